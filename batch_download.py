@@ -7,7 +7,7 @@ Processes URLs from a text file
 import sys
 import argparse
 from pathlib import Path
-from youtube_downloader import YouTubeDownloader
+from youtube_downloader import YouTubeDownloader, open_metadata_cache
 from colorama import Fore, init
 
 init(autoreset=True)
@@ -111,6 +111,10 @@ File format:
                        help='Skip downloading subtitles')
     parser.add_argument('--embed-subtitles', action='store_true',
                        help='Embed subtitles in video files instead of separate files')
+    parser.add_argument('--aria2c', action='store_true',
+                       help='Download through aria2c (must be installed) using several connections per file')
+    parser.add_argument('--refresh-metadata', action='store_true',
+                       help='Ignore playlist information cached by earlier runs')
     
     args = parser.parse_args()
     
@@ -163,10 +167,14 @@ File format:
     
     # Create downloader and process URLs
     try:
+        metadata_cache = open_metadata_cache(refresh=args.refresh_metadata)
+        
         downloader = YouTubeDownloader(
             download_path=args.output,
             download_subtitles=download_subtitles,
-            embed_subtitles=embed_subtitles
+            embed_subtitles=embed_subtitles,
+            metadata_cache=metadata_cache,
+            use_aria2c=args.aria2c
         )
         results = downloader.download_multiple_urls(urls)
         
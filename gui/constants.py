@@ -40,6 +40,13 @@ PROGRESS_COLUMN_WIDTHS = {
     "Progress": 80
 }
 
+# Row background per status, applied as Treeview tags
+PROGRESS_STATUS_COLORS = {
+    "Downloading": "#e8f0fe",
+    "Completed": "#d4f5d4",
+    "Failed": "#f8d7da"
+}
+
 # Help text for format strings
 FORMAT_HELP_TEXT = """🎥 Custom Format Examples:
 
@@ -68,8 +75,34 @@ PADDING_STANDARD = 8
 PADDING_SMALL = 4
 PADDING_LARGE = 15
 
-# Message update interval (ms)
-MESSAGE_UPDATE_INTERVAL = 100
+# Message update intervals (ms)
+MESSAGE_UPDATE_INTERVAL_BUSY = 20  # Used right after a tick that drained messages
+MESSAGE_UPDATE_INTERVAL_IDLE = 250  # Used while the queue stays empty
+MAX_MESSAGES_PER_UPDATE = 50  # Messages handled per tick before yielding to Tk
+
+# Number of URLs downloaded at the same time (settings['concurrency'] overrides it)
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+
+# Progress hook throttling: a "downloading" update for a URL is only sent if this
+# many seconds have passed or progress moved this many percentage points
+PROGRESS_EMIT_INTERVAL = 0.1
+PROGRESS_EMIT_MIN_STEP = 1.0
+
+# Progress rows: a percentage-only update to a row is dropped if the row was
+# refreshed less than this many seconds ago (status changes always go through)
+PROGRESS_ROW_MIN_INTERVAL = 0.066
+
+# Progress bars and their labels are refreshed by a ticker every this many ms
+PROGRESS_TICK_INTERVAL = 66
+
+# Queued log lines are written to the log widget every this many ms, at most
+# this many lines per write
+LOG_FLUSH_INTERVAL = 100
+MAX_LOG_LINES_PER_FLUSH = 200
+
+# Extracted video/playlist info is reused for this many seconds, up to this many URLs
+INFO_CACHE_TTL = 300.0
+INFO_CACHE_MAX = 256
 
 # Process termination timeout (seconds)
 PROCESS_TERMINATION_TIMEOUT = 3.0
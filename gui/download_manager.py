@@ -7,16 +7,12 @@ import threading
 import queue
 import subprocess
 import signal
-import os
+import re
 import time
-import traceback
+import logging
 import sys
-
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     import yt_dlp
@@ -25,7 +21,102 @@ except ImportError:
     sys.exit(1)
 
 from youtube_downloader import YouTubeDownloader
-from .constants import PROCESS_TERMINATION_TIMEOUT
+from .constants import (
+    PROCESS_TERMINATION_TIMEOUT, DEFAULT_DOWNLOAD_CONCURRENCY,
+    PROGRESS_EMIT_INTERVAL, PROGRESS_EMIT_MIN_STEP, INFO_CACHE_TTL, INFO_CACHE_MAX
+)
+
+logger = logging.getLogger(__name__)
+
+# Files whose progress is not shown: audio fragments, subtitles and temp files
+_SKIP_RE = re.compile(r'fragment|\.vtt|\.srt|temp', re.IGNORECASE)
+
+
+class _ProgressHook:
+    """yt-dlp progress hook reporting a DownloadManager's downloads to the GUI
+    
+    The manager state used on every callback is bound to slots up front, so
+    each call reads plain attributes instead of going through the manager.
+    """
+    
+    __slots__ = ('manager', 'stop_event', 'queue', 'thread_state', 'last_emit')
+    
+    def __init__(self, manager):
+        self.manager = manager
+        self.stop_event = manager._stop_event
+        self.queue = manager.message_queue
+        self.thread_state = manager._thread_state
+        self.last_emit = manager._last_emit
+    
+    def __call__(self, d):
+        # Abort this download on stop. yt-dlp lets DownloadCancelled through
+        # even with ignoreerrors, so the pool thread is freed straight away.
+        if self.stop_event.is_set():
+            logger.debug("Download stopped flag detected in progress hook")
+            raise yt_dlp.utils.DownloadCancelled()
+        
+        try:
+            # URL being downloaded by the pool thread that invoked this hook
+            current_url = getattr(self.thread_state, 'url', None)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Progress: status=%s file=%s dl=%s tot=%s url=%s",
+                             d.get('status'), d.get('filename', 'N/A'),
+                             d.get('downloaded_bytes', 0), d.get('total_bytes', 'N/A'),
+                             current_url)
+            
+            if d['status'] == 'downloading':
+                # Extract progress information
+                downloaded = d.get('downloaded_bytes', 0)
+                total = d.get('total_bytes') or d.get('total_bytes_estimate')
+                filename = d.get('filename', '')
+                
+                # Skip progress updates for audio fragments and subtitle files
+                if filename and _SKIP_RE.search(filename):
+                    return
+                
+                if total and downloaded:
+                    progress_percent = (downloaded / total) * 100
+                    
+                    # Throttle: skip the update unless enough time has passed
+                    # or progress moved noticeably since the last one sent
+                    now = time.monotonic()
+                    prev_ts, prev_pct = self.last_emit.get(current_url, (0.0, -1.0))
+                    if (now - prev_ts < PROGRESS_EMIT_INTERVAL
+                            and abs(progress_percent - prev_pct) < PROGRESS_EMIT_MIN_STEP):
+                        return
+                    self.last_emit[current_url] = (now, progress_percent)
+                    
+                    speed = d.get('speed', 0)
+                    eta = d.get('eta', 0)
+                    
+                    # Format speed and ETA safely
+                    speed_str = f"{speed/1024/1024:.1f} MB/s" if speed else "N/A"
+                    eta_str = f"{eta}s" if eta else "N/A"
+                    
+                    # Update current progress
+                    progress_text = f"Downloading: {progress_percent:.1f}% - {speed_str} - ETA: {eta_str}"
+                    self.queue.put(("current_progress", progress_text, progress_percent))
+                    
+                    # Update video progress
+                    if current_url:
+                        self.queue.put(("video_progress", {
+                            "url": current_url,
+                            "status": "Downloading",
+                            "progress": progress_percent
+                        }))
+                        
+            elif d['status'] == 'finished':
+                logger.debug("Download finished: %s", d.get('filename', 'N/A'))
+                if current_url:
+                    self.queue.put(("video_progress", {
+                        "url": current_url,
+                        "status": "Completed",
+                        "progress": 100
+                    }))
+                    
+        except Exception as e:
+            logger.exception("Error in progress hook: %s", e)
 
 
 class DownloadManager:
@@ -35,15 +126,51 @@ class DownloadManager:
         self.message_queue = message_queue
         self.downloader = None
         self.download_stopped = False
-        self.running_processes = []
+        # yt-dlp child processes registered when spawned
+        self.running_processes = set()
         self.download_thread = None
-        self.current_downloading_url = None
+        
+        # Set by stop_download; checked by pool workers before and during downloads
+        self._stop_event = threading.Event()
+        
+        # Per-thread state for pool workers (the URL each one is downloading)
+        self._thread_state = threading.local()
+        
+        # URL -> (monotonic time, percent) of the last progress update sent
+        self._last_emit = {}
+        
+        # URL -> (monotonic time, info) of recent extractions, oldest first
+        self._info_cache = OrderedDict()
+        self._info_cache_lock = threading.Lock()
+        
+        # yt-dlp options for the current batch, built by _download_worker
+        self._playlist_ydl_opts = None
+        self._single_ydl_opts = None
+        
+        # YoutubeDL instances reused by the pool threads, closed when the batch ends
+        self._ydl_local = threading.local()
+        self._open_ydls = []
+        self._open_ydls_lock = threading.Lock()
+    
+    def is_running(self):
+        """Return True while a download worker (including a stopping one) is alive"""
+        return self.download_thread is not None and self.download_thread.is_alive()
     
     def start_download(self, urls, settings, progress_tracker):
-        """Start the download process in a separate thread"""
+        """Start the download process in a separate thread
+        
+        Raises RuntimeError if the previous worker has not exited yet - its pool
+        may still be running, and resetting the shared state under it would
+        let it carry on.
+        """
+        if self.is_running():
+            raise RuntimeError("The previous download is still running")
+        
         # Reset state
         self.download_stopped = False
+        self._stop_event.clear()
         self.running_processes.clear()
+        self._last_emit.clear()
         
         # Start download thread
         self.download_thread = threading.Thread(
@@ -55,21 +182,14 @@ class DownloadManager:
     
     def stop_download(self):
         """Stop the download process"""
-        print("[DOWNLOAD MGR DEBUG] Stop download requested")
+        logger.debug("Stop download requested")
         self.download_stopped = True
+        self._stop_event.set()
         
-        # Terminate all running processes
+        # Terminate running child processes; downloads in progress are cancelled
+        # by the progress hook. The worker sends "stopped" once its pool has drained.
         self._terminate_all_processes()
-        
-        # Wait for thread to finish gracefully (with timeout)
-        if self.download_thread and self.download_thread.is_alive():
-            print("[DOWNLOAD MGR DEBUG] Waiting for download thread to finish...")
-            self.download_thread.join(timeout=PROCESS_TERMINATION_TIMEOUT)
-            
-            if self.download_thread.is_alive():
-                print("[DOWNLOAD MGR DEBUG] Download thread did not finish in time")
-        
-        print("[DOWNLOAD MGR DEBUG] Download stop completed")
+        logger.debug("Download stop requested, waiting for the worker to exit")
     
     def _download_worker(self, urls, settings, progress_tracker):
         """Worker function for downloading (runs in separate thread)"""
@@ -87,86 +207,51 @@ class DownloadManager:
             # Set the format from GUI selection
             self.downloader.set_format(selected_format)
             
-            # Create a custom progress hook
-            def progress_hook(d):
-                try:
-                    # Check if download was stopped
-                    if self.download_stopped:
-                        print(f"[DOWNLOAD DEBUG] Download stopped flag detected in progress hook")
-                        self._terminate_all_processes()
-                        return
-                    
-                    print(f"[DOWNLOAD DEBUG] Progress hook called:")
-                    print(f"  Status: {d.get('status')}")
-                    print(f"  Filename: {d.get('filename', 'N/A')}")
-                    print(f"  Downloaded: {d.get('downloaded_bytes', 0)}")
-                    print(f"  Total: {d.get('total_bytes', 'N/A')}")
-                    print(f"  Current downloading URL: {self.current_downloading_url}")
-                    
-                    if d['status'] == 'downloading':
-                        # Extract progress information
-                        downloaded = d.get('downloaded_bytes', 0)
-                        total = d.get('total_bytes') or d.get('total_bytes_estimate')
-                        filename = d.get('filename', '')
-                        
-                        # Skip progress updates for audio fragments and subtitle files
-                        if any(skip_term in filename.lower() for skip_term in ['fragment', '.vtt', '.srt', 'temp']):
-                            return
-                        
-                        if total and downloaded:
-                            progress_percent = (downloaded / total) * 100
-                            speed = d.get('speed', 0)
-                            eta = d.get('eta', 0)
-                            
-                            # Format speed and ETA safely
-                            speed_str = f"{speed/1024/1024:.1f} MB/s" if speed else "N/A"
-                            eta_str = f"{eta}s" if eta else "N/A"
-                            
-                            # Update current progress
-                            progress_text = f"Downloading: {progress_percent:.1f}% - {speed_str} - ETA: {eta_str}"
-                            self.message_queue.put(("current_progress", progress_text, progress_percent))
-                            
-                            # Update video progress
-                            if self.current_downloading_url:
-                                self.message_queue.put(("video_progress", {
-                                    "url": self.current_downloading_url,
-                                    "status": "Downloading",
-                                    "progress": progress_percent
-                                }))
-                                
-                    elif d['status'] == 'finished':
-                        print(f"[DOWNLOAD DEBUG] Download finished: {d.get('filename', 'N/A')}")
-                        if self.current_downloading_url:
-                            self.message_queue.put(("video_progress", {
-                                "url": self.current_downloading_url,
-                                "status": "Completed",
-                                "progress": 100
-                            }))
-                            
-                except Exception as e:
-                    print(f"[DOWNLOAD DEBUG] Error in progress hook: {e}")
-                    traceback.print_exc()
+            # One progress hook is shared by every URL in the batch
+            progress_hook = _ProgressHook(self)
             
-            # Process each URL
+            # Format and progress hook are fixed for the batch, so the yt-dlp
+            # options are built once here rather than for every URL
+            self._playlist_ydl_opts = {**self.downloader.playlist_opts,
+                                       'format': selected_format, 'progress_hooks': [progress_hook]}
+            self._single_ydl_opts = {**self.downloader.single_video_opts,
+                                     'format': selected_format, 'progress_hooks': [progress_hook]}
+            self._ydl_local = threading.local()
+            
+            # Download the URLs concurrently; each pool thread records the URL it is
+            # working on in self._thread_state so progress_hook can report it
             results = {}
-            for i, url in enumerate(urls, 1):
-                if self.download_stopped:
-                    print(f"[DOWNLOAD DEBUG] Download stopped, breaking URL loop")
-                    break
-                
-                print(f"[DOWNLOAD DEBUG] ===== Processing URL {i}/{len(urls)} =====")
-                print(f"[DOWNLOAD DEBUG] URL: {url}")
+            max_workers = max(1, min(len(urls), settings.get('concurrency', DEFAULT_DOWNLOAD_CONCURRENCY)))
+            logger.debug("Downloading with %s workers", max_workers)
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._download_task, i, len(urls), url, progress_tracker): url
+                    for i, url in enumerate(urls, 1)
+                }
                 
-                try:
-                    self.current_downloading_url = url
+                completed = 0
+                for future in as_completed(futures):
+                    url = futures[future]
                     
-                    # Update current progress
-                    self.message_queue.put(("current_progress", f"Processing URL {i}/{len(urls)}: {url[:50]}...", 0))
-                    self.message_queue.put(("log", f"Starting download {i}/{len(urls)}: {url}"))
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.exception("Error processing URL %s: %s", url, e)
+                        results[url] = False
+                        self.message_queue.put(("log", f"❌ Error downloading {url}: {str(e)}"))
+                        self.message_queue.put(("video_progress", {
+                            "url": url,
+                            "status": "Failed",
+                            "progress": 0
+                        }))
+                        continue
                     
-                    # Use our custom download with progress tracking instead of the built-in method
-                    result = self._download_with_progress(url, selected_format, progress_hook, progress_tracker)
+                    if result is None:
+                        # Skipped because the download was stopped before it started
+                        continue
                     
+                    completed += 1
                     if result:
                         results[url] = True
                         self.message_queue.put(("log", f"✅ Successfully downloaded: {url}"))
@@ -186,27 +271,22 @@ class DownloadManager:
                         }))
                     
                     # Update overall progress
-                    self.message_queue.put(("overall_progress", f"Completed {i}/{len(urls)} downloads"))
-                    
-                except Exception as e:
-                    print(f"[DOWNLOAD DEBUG] Error processing URL {url}: {e}")
-                    traceback.print_exc()
-                    results[url] = False
-                    self.message_queue.put(("log", f"❌ Error downloading {url}: {str(e)}"))
-                    self.message_queue.put(("video_progress", {
-                        "url": url,
-                        "status": "Failed",
-                        "progress": 0
-                    }))
+                    self.message_queue.put(("overall_progress", f"Completed {completed}/{len(urls)} downloads"))
+            
+            # Leaving the pool waited for the running downloads, which abort at
+            # their next progress event once the stop event is set
+            if self._stop_event.is_set():
+                self.message_queue.put(("stopped",))
+                return
             
             # Send completion message
             successful = sum(1 for success in results.values() if success)
             failed = len(urls) - successful
             
-            print(f"[DOWNLOAD DEBUG] ===== DOWNLOAD COMPLETE =====")
-            print(f"[DOWNLOAD DEBUG] Successful: {successful}")
-            print(f"[DOWNLOAD DEBUG] Failed: {failed}")
-            print(f"[DOWNLOAD DEBUG] Total: {len(urls)}")
+            logger.debug("===== DOWNLOAD COMPLETE =====")
+            logger.debug("Successful: %s", successful)
+            logger.debug("Failed: %s", failed)
+            logger.debug("Total: %s", len(urls))
             
             # Final overall progress update
             self.message_queue.put(("overall_progress", f"Finalizing... {successful}/{len(urls)} completed"))
@@ -218,28 +298,98 @@ class DownloadManager:
             }))
             
         except KeyboardInterrupt:
-            print(f"[DOWNLOAD DEBUG] Download interrupted by user")
+            logger.debug("Download interrupted by user")
             self.message_queue.put(("error", "Download was interrupted by user"))
         except Exception as e:
-            print(f"[DOWNLOAD DEBUG CRITICAL ERROR] {e}")
-            traceback.print_exc()
+            logger.exception("Critical download error: %s", e)
             self.message_queue.put(("error", f"Download error: {e}"))
+        finally:
+            # Save cookies and release connections held by the shared instances
+            with self._open_ydls_lock:
+                open_ydls, self._open_ydls = self._open_ydls, []
+            for ydl in open_ydls:
+                ydl.close()
+    
+    def _get_shared_ydl(self, kind):
+        """Return this thread's 'single' or 'playlist' YoutubeDL, creating it on first use
+        
+        Building a YoutubeDL loads extractors and cookies, so each pool thread
+        keeps one instance per kind for the whole batch.
+        """
+        instances = getattr(self._ydl_local, 'instances', None)
+        if instances is None:
+            instances = self._ydl_local.instances = {}
+        
+        ydl = instances.get(kind)
+        if ydl is None:
+            opts = self._playlist_ydl_opts if kind == 'playlist' else self._single_ydl_opts
+            # YoutubeDL rewrites its params in place, so give it its own copy
+            ydl = instances[kind] = yt_dlp.YoutubeDL(opts.copy())
+            with self._open_ydls_lock:
+                self._open_ydls.append(ydl)
+        return ydl
+    
+    def _download_task(self, i, total, url, progress_tracker):
+        """Download one URL on a pool thread
+        
+        Returns None if the download was stopped before or while this URL ran.
+        """
+        if self._stop_event.is_set():
+            return None
+        
+        self._thread_state.url = url
+        try:
+            # Update current progress
+            self.message_queue.put(("current_progress", f"Processing URL {i}/{total}: {url[:50]}...", 0))
+            self.message_queue.put(("log", f"Starting download {i}/{total}: {url}"))
+            
+            # Use our custom download with progress tracking instead of the built-in method
+            result = self._download_with_progress(url, progress_tracker)
+            if not result:
+                # A retry should extract fresh info
+                self._invalidate_info(url)
+            return result
+        finally:
+            self._thread_state.url = None
+    
+    def _get_info_cached(self, url):
+        """Extract (flat) info for url, reusing a recent extraction if there is one"""
+        now = time.monotonic()
+        with self._info_cache_lock:
+            cached = self._info_cache.get(url)
+            if cached and now - cached[0] < INFO_CACHE_TTL:
+                self._info_cache.move_to_end(url)
+                return cached[1]
+        
+        info = self.downloader.get_info(url)
+        if info:
+            with self._info_cache_lock:
+                self._info_cache[url] = (now, info)
+                self._info_cache.move_to_end(url)
+                while len(self._info_cache) > INFO_CACHE_MAX:
+                    self._info_cache.popitem(last=False)
+        return info
     
-    def _download_with_progress(self, url, selected_format, progress_hook, progress_tracker):
+    def _invalidate_info(self, url):
+        """Forget the cached info for url (e.g. after its download failed)"""
+        with self._info_cache_lock:
+            self._info_cache.pop(url, None)
+    
+    def _download_with_progress(self, url, progress_tracker):
         """Download a single URL with progress tracking"""
         try:
             # Check if this is a playlist
-            info = self.downloader.get_info(url)
+            info = self._get_info_cached(url)
             if not info:
                 return False
             
-            is_playlist = self.downloader.is_playlist_url(url)
+            is_playlist = info.get('_type') == 'playlist' or 'entries' in info
             
             if is_playlist:
-                print(f"[DOWNLOAD DEBUG] Detected playlist")
+                logger.debug("Detected playlist")
                 
-                # Get full playlist info
-                playlist_info = self.downloader.get_playlist_info(url)
+                # The flat extraction above already lists the playlist entries
+                playlist_info = info
                 if not playlist_info or 'entries' not in playlist_info:
                     self.message_queue.put(("log", f"❌ Could not get playlist information"))
                     return False
@@ -251,172 +401,70 @@ class DownloadManager:
                 if unavailable_count > 0:
                     self.message_queue.put(("log", f"⚠️ {unavailable_count} videos in playlist are unavailable (private/deleted)"))
                 
-                # Clear existing progress and add playlist videos
-                progress_tracker.clear_video_progress()
-                for idx, entry in enumerate(available_entries, 1):
-                    if entry and 'title' in entry:
-                        video_url = f"https://www.youtube.com/watch?v={entry['id']}"
-                        progress_tracker.add_video_to_progress(idx, entry['title'], video_url)
-                
-                # Update total videos count
-                progress_tracker.total_videos = len(available_entries)
+                # Add the playlist videos - the GUI thread owns the tree, and other
+                # URLs may be downloading alongside this one, so nothing is cleared
+                self.message_queue.put(("add_videos", [
+                    (idx, entry['title'], f"https://www.youtube.com/watch?v={entry['id']}")
+                    for idx, entry in enumerate(available_entries, 1)
+                    if entry and 'title' in entry
+                ]))
                 self.message_queue.put(("log", f"📋 Playlist: {len(available_entries)} videos ready for download"))
                 
-                # Create custom yt-dlp options with progress hook
-                ydl_opts = self.downloader.playlist_opts.copy()
-                ydl_opts['format'] = selected_format
-                ydl_opts['progress_hooks'] = [progress_hook]
-                
                 # Download playlist with progress tracking
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([url])
+                self._get_shared_ydl('playlist').download([url])
                 
                 return True
                 
             else:
-                # Single video
-                video_title = info.get('title', 'Unknown')
-                
-                # Create custom yt-dlp options with progress hook
-                ydl_opts = self.downloader.single_video_opts.copy()
-                ydl_opts['format'] = selected_format
-                ydl_opts['progress_hooks'] = [progress_hook]
-                
                 # Download single video with progress tracking
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([url])
+                self._get_shared_ydl('single').download([url])
                 
                 return True
                 
+        except yt_dlp.utils.DownloadCancelled:
+            return None
         except Exception as e:
-            print(f"[DOWNLOAD MGR DEBUG] Error in _download_with_progress: {e}")
-            traceback.print_exc()
+            logger.exception("Error in _download_with_progress: %s", e)
             return False
 
-    def _run_ytdlp_with_tracking(self, url, selected_format, progress_hook, progress_tracker):
-        """Run yt-dlp download with process tracking for proper termination"""
-        try:
-            # Check if this is a playlist
-            info = self.downloader.get_info(url)
-            if not info:
-                return False
-            
-            is_playlist = self.downloader.is_playlist_url(url)
-            
-            if is_playlist:
-                print(f"[DOWNLOAD DEBUG] Detected playlist")
-                
-                # Get full playlist info
-                playlist_info = self.downloader.get_playlist_info(url)
-                if not playlist_info or 'entries' not in playlist_info:
-                    self.message_queue.put(("log", f"❌ Could not get playlist information"))
-                    return False
-                
-                # Filter out None entries (unavailable videos)
-                available_entries = [entry for entry in playlist_info['entries'] if entry is not None]
-                unavailable_count = len(playlist_info['entries']) - len(available_entries)
-                
-                if unavailable_count > 0:
-                    self.message_queue.put(("log", f"⚠️ {unavailable_count} videos in playlist are unavailable (private/deleted)"))
-                
-                # Add available videos to progress tracker
-                for idx, entry in enumerate(available_entries, 1):
-                    if entry and 'title' in entry:
-                        video_url = f"https://www.youtube.com/watch?v={entry['id']}"
-                        progress_tracker.add_video_to_progress(idx, entry['title'], video_url)
-                
-                # Update total videos count
-                progress_tracker.total_videos = len(available_entries)
-                self.message_queue.put(("log", f"📋 Playlist: {len(available_entries)} videos ready for download"))
-                
-                # Use the downloader's built-in playlist download method
-                success = self.downloader.download_playlist(url)
-                
-                if success:
-                    # Mark all videos as completed
-                    for idx, entry in enumerate(available_entries, 1):
-                        if entry and 'title' in entry:
-                            video_url = f"https://www.youtube.com/watch?v={entry['id']}"
-                            self.message_queue.put(("video_progress", {
-                                "url": video_url,
-                                "status": "Completed",
-                                "progress": 100
-                            }))
-                
-                return success
-                
-            else:
-                # Single video
-                progress_tracker.add_video_to_progress(1, info.get('title', 'Unknown'), url)
-                progress_tracker.total_videos = 1
-                
-                # Use the downloader's built-in single video download method
-                success = self.downloader.download_single_video(url)
-                
-                if success:
-                    self.message_queue.put(("video_progress", {
-                        "url": url,
-                        "status": "Completed",
-                        "progress": 100
-                    }))
-                
-                return success
-                
-        except Exception as e:
-            print(f"[DOWNLOAD MGR DEBUG] Error in _run_ytdlp_with_tracking: {e}")
-            traceback.print_exc()
-            return False
-    
     def _terminate_all_processes(self):
-        """Terminate all running yt-dlp processes"""
+        """Terminate yt-dlp processes spawned by this manager.
+
+        Only processes registered in ``running_processes`` are signalled;
+        yt-dlp itself runs in-process and stops through the progress hook.
+        """
         try:
-            print(f"[DOWNLOAD MGR DEBUG] Terminating {len(self.running_processes)} processes...")
+            logger.debug("Terminating %s processes...", len(self.running_processes))
             
             # First, try to terminate processes gracefully
-            for proc in self.running_processes[:]:
+            for proc in self.running_processes:
                 try:
                     if proc.poll() is None:  # Process is still running
-                        print(f"[DOWNLOAD MGR DEBUG] Terminating process {proc.pid}")
+                        logger.debug("Terminating process %s", proc.pid)
                         proc.terminate()
                 except Exception as e:
-                    print(f"[DOWNLOAD MGR DEBUG] Error terminating process {proc.pid}: {e}")
-            
-            # Wait a moment for graceful termination
-            time.sleep(1)
+                    logger.warning("Error terminating process %s: %s", proc.pid, e)
             
-            # Force kill any remaining processes
-            for proc in self.running_processes[:]:
+            # Reap each process as soon as it exits; force kill the ones
+            # still running once the shared deadline passes
+            deadline = time.monotonic() + PROCESS_TERMINATION_TIMEOUT
+            for proc in self.running_processes:
                 try:
-                    if proc.poll() is None:  # Process is still running
-                        print(f"[DOWNLOAD MGR DEBUG] Force killing process {proc.pid}")
+                    remaining = max(0, deadline - time.monotonic())
+                    proc.wait(timeout=remaining)
+                except subprocess.TimeoutExpired:
+                    try:
+                        logger.debug("Force killing process %s", proc.pid)
                         proc.kill()
-                        self.running_processes.remove(proc)
+                        proc.wait(timeout=1.0)
+                    except Exception as e:
+                        logger.warning("Error killing process %s: %s", proc.pid, e)
                 except Exception as e:
-                    print(f"[DOWNLOAD MGR DEBUG] Error killing process {proc.pid}: {e}")
+                    logger.warning("Error waiting for process %s: %s", proc.pid, e)
             
-            # Clear the process list
+            # Clear the process set
             self.running_processes.clear()
             
-            # Additionally, try to kill any yt-dlp processes that might be running
-            if PSUTIL_AVAILABLE:
-                try:
-                    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                        if 'yt-dlp' in proc.info['name'] or 'python' in proc.info['name']:
-                            if proc.info['cmdline'] and any('yt-dlp' in cmd for cmd in proc.info['cmdline']):
-                                print(f"[DOWNLOAD MGR DEBUG] Killing yt-dlp process {proc.info['pid']}")
-                                proc.kill()
-                except Exception as e:
-                    print(f"[DOWNLOAD MGR DEBUG] Error using psutil to kill processes: {e}")
-            else:
-                try:
-                    if os.name == 'nt':  # Windows
-                        os.system('taskkill /f /im python.exe 2>nul')
-                        os.system('taskkill /f /im yt-dlp.exe 2>nul')
-                    else:  # Unix-like
-                        os.system('pkill -f yt-dlp 2>/dev/null')
-                except Exception as e:
-                    print(f"[DOWNLOAD MGR DEBUG] Error using system commands to kill processes: {e}")
-                
         except Exception as e:
-            print(f"[DOWNLOAD MGR DEBUG] Error in _terminate_all_processes: {e}")
-            self.running_processes.clear()  # Clear the list anyway
+            logger.warning("Error in _terminate_all_processes: %s", e)
+            self.running_processes.clear()  # Clear the set anyway
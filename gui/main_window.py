@@ -7,15 +7,74 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import queue
 import os
+import threading
+import re
+import logging
 
 from .constants import (
     DEFAULT_WINDOW_SIZE, DEFAULT_MIN_SIZE, DEFAULT_DOWNLOAD_PATH,
-    MAIN_BG_COLOR, SECONDARY_BG_COLOR, MESSAGE_UPDATE_INTERVAL
+    MAIN_BG_COLOR, SECONDARY_BG_COLOR,
+    MESSAGE_UPDATE_INTERVAL_BUSY, MESSAGE_UPDATE_INTERVAL_IDLE, MAX_MESSAGES_PER_UPDATE
 )
 from .ui_components import UIComponents
 from .progress_tracker import ProgressTracker
 from .download_manager import DownloadManager
 
+# Hosts accepted as YouTube URLs
+_YT_HOST_RE = re.compile(r'(?:youtube\.com|youtu\.be)', re.IGNORECASE)
+
+
+class WakeupQueue:
+    """SimpleQueue that also makes a pipe readable when a message is put
+    
+    The Tk loop watches the pipe with createfilehandler and drains the queue as
+    soon as something arrives, instead of polling it on a timer.
+    """
+    
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.set_blocking(self._write_fd, False)
+        # Set once a wakeup byte is in flight, so a burst of puts writes only one.
+        # Several download threads put at once, so check-and-set under a lock
+        self._signalled = False
+        self._signal_lock = threading.Lock()
+    
+    def fileno(self):
+        """Descriptor that becomes readable when messages are waiting"""
+        return self._read_fd
+    
+    def put(self, item):
+        """Queue item and wake the reader"""
+        self._queue.put(item)
+        with self._signal_lock:
+            if self._signalled:
+                return
+            self._signalled = True
+        try:
+            os.write(self._write_fd, b'\x00')
+        except BlockingIOError:
+            pass  # Pipe is full, so the reader is already due to wake up
+    
+    def get_nowait(self):
+        """Remove and return an item, raising queue.Empty if there is none"""
+        return self._queue.get_nowait()
+    
+    def clear_wakeup(self):
+        """Consume pending wakeup bytes; call before draining the queue"""
+        try:
+            while os.read(self._read_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        # Only clear the flag once the pipe is empty: clearing it first would let
+        # a put's byte be drained here while the flag stays set, and no later put
+        # would write again. A put that sees the flag still set is covered by the
+        # queue drain that follows this call
+        with self._signal_lock:
+            self._signalled = False
+
 
 class YouTubeDownloaderGUI:
     """Main GUI window for the YouTube Downloader"""
@@ -30,7 +89,15 @@ class YouTubeDownloaderGUI:
         
         # Initialize components
         self.download_path = DEFAULT_DOWNLOAD_PATH
-        self.message_queue = queue.Queue()
+        # Download threads produce, update_messages consumes. Where Tk can watch
+        # file descriptors (not on Windows) a put wakes the UI straight away;
+        # otherwise update_messages polls a SimpleQueue on a timer.
+        self._wakeup_enabled = hasattr(self.root.tk, 'createfilehandler')
+        if self._wakeup_enabled:
+            self.message_queue = WakeupQueue()
+            self.root.tk.createfilehandler(self.message_queue, tk.READABLE, self._on_message_wakeup)
+        else:
+            self.message_queue = queue.SimpleQueue()
         
         # Create string variables for progress display
         overall_progress_var = tk.StringVar(value="Ready")
@@ -93,13 +160,25 @@ class YouTubeDownloaderGUI:
     
     def start_download(self):
         """Start the download process"""
+        if self.download_manager.is_running():
+            # A stopped batch is still draining; the buttons come back on "stopped"
+            return
+        
         urls_text = self.ui.get_urls_text()
         if not urls_text:
             messagebox.showwarning("No URLs", "Please enter at least one YouTube URL")
             return
         
-        urls = [url.strip() for url in urls_text.split('\n') if url.strip()]
-        invalid_urls = [url for url in urls if 'youtube.com' not in url and 'youtu.be' not in url]
+        # Split, strip, drop repeated URLs (keeping the first occurrence) and
+        # validate in a single pass
+        seen = set()
+        urls, invalid_urls = [], []
+        for line in urls_text.splitlines():
+            url = line.strip()
+            if not url or url in seen:
+                continue
+            seen.add(url)
+            (urls if _YT_HOST_RE.search(url) else invalid_urls).append(url)
         
         if invalid_urls:
             messagebox.showwarning("Invalid URLs", 
@@ -118,12 +197,11 @@ class YouTubeDownloaderGUI:
         self.progress_tracker.current_video_index = 0
         
         # Pre-populate video list for single URLs
-        for i, url in enumerate(urls, 1):
-            self.progress_tracker.add_video_to_progress(i, f"Video {i}", url)
+        self.progress_tracker.add_videos_bulk([(i, f"Video {i}", url) for i, url in enumerate(urls, 1)])
         
         # Update progress display
-        self.progress_tracker.overall_progress_var.set(f"Starting download of {len(urls)} URLs...")
-        self.progress_tracker.current_progress_var.set("Initializing...")
+        self.progress_tracker.set_overall_text(f"Starting download of {len(urls)} URLs...")
+        self.progress_tracker.update_current_progress("Initializing...")
         
         # Get download settings
         settings = self.ui.get_download_settings()
@@ -134,66 +212,117 @@ class YouTubeDownloaderGUI:
     
     def stop_download(self):
         """Stop the download process"""
-        self.ui.log_message("⏹️ Stopping download...", "orange")
-        self.progress_tracker.overall_progress_var.set("Stopping download...")
-        self.progress_tracker.current_progress_var.set("Stopping...")
+        self.ui.log_message("⏹️ Stopping download...")
+        self.progress_tracker.set_overall_text("Stopping download...")
+        self.progress_tracker.update_current_progress("Stopping...")
         
-        # Stop the download manager
+        # Stop the download manager. Download stays disabled until the worker
+        # has exited and sent its "stopped" message.
+        self.ui.set_download_buttons_state(download_enabled=False, stop_enabled=False)
         self.download_manager.stop_download()
-        
-        # Update UI state
-        self.progress_tracker.overall_progress_var.set("Download stopped")
-        self.progress_tracker.current_progress_var.set("Stopped")
-        self.ui.set_download_buttons_state(download_enabled=True, stop_enabled=False)
-        self.ui.log_message("❌ Download stopped by user")
     
     def update_messages(self):
-        """Process messages from download thread"""
+        """Process messages from download thread and schedule the next check"""
+        message_count = self._process_messages()
+        
+        # Schedule next update - poll quickly while messages are flowing, back off
+        # when idle. With pipe wakeups the timer is only a safety net.
+        if message_count >= MAX_MESSAGES_PER_UPDATE:
+            interval = MESSAGE_UPDATE_INTERVAL_BUSY
+        elif self._wakeup_enabled or message_count == 0:
+            interval = MESSAGE_UPDATE_INTERVAL_IDLE
+        else:
+            interval = MESSAGE_UPDATE_INTERVAL_BUSY
+        self.root.after(interval, self.update_messages)
+    
+    def _on_message_wakeup(self, fileno, mask):
+        """Drain the queue as soon as the download threads put a message"""
+        self.message_queue.clear_wakeup()
+        if self._process_messages() >= MAX_MESSAGES_PER_UPDATE:
+            # More may be waiting; let Tk redraw before handling the rest
+            self.root.after(MESSAGE_UPDATE_INTERVAL_BUSY, self._on_message_wakeup, fileno, mask)
+    
+    def _process_messages(self):
+        """Handle up to MAX_MESSAGES_PER_UPDATE queued messages, returning how many were handled"""
+        message_count = 0
+        
+        # Log lines and progress messages are coalesced: logs are inserted in one
+        # go, video_progress fields are merged per URL and only the last
+        # current_progress/overall_progress is applied once per tick
+        log_lines = []
+        latest_video = {}
+        latest_current = None
+        latest_overall = None
         try:
-            message_count = 0
-            while True:
+            # Limit processing to avoid UI freezing
+            while message_count < MAX_MESSAGES_PER_UPDATE:
                 message_type, *data = self.message_queue.get_nowait()
                 message_count += 1
                 
-                if message_type == "log":
-                    self.ui.log_message(data[0])
-                
-                elif message_type == "video_progress":
+                if message_type == "video_progress":
                     progress_data = data[0]
-                    self.progress_tracker.update_video_progress(
-                        url=progress_data["url"],
-                        status=progress_data.get("status"),
-                        progress=progress_data.get("progress"),
-                        title=progress_data.get("title")
-                    )
-                    self.progress_tracker.update_overall_progress()
+                    latest_video.setdefault(progress_data["url"], {}).update(
+                        (key, value) for key, value in progress_data.items()
+                        if key != "url" and value is not None)
+                    continue
                 
                 elif message_type == "current_progress":
-                    if len(data) >= 2:
-                        self.progress_tracker.update_current_progress(data[0], data[1])
-                    else:
-                        self.progress_tracker.update_current_progress(data[0])
+                    latest_current = data
+                    continue
                 
                 elif message_type == "overall_progress":
-                    self.progress_tracker.overall_progress_var.set(data[0])
+                    latest_overall = data[0]
+                    continue
+                
+                elif message_type == "log":
+                    log_lines.append(data[0])
+                    continue
+                
+                # Everything else expects the log and progress display to be up to date
+                self._apply_pending_updates(log_lines, latest_video, latest_current, latest_overall)
+                latest_current = latest_overall = None
+                
+                if message_type == "add_videos":
+                    self.progress_tracker.add_videos_bulk(data[0])
+                    self.progress_tracker.update_overall_progress()
                 
                 elif message_type == "complete":
                     completion_data = data[0]
                     self._handle_download_completion(completion_data)
                 
+                elif message_type == "stopped":
+                    self.progress_tracker.set_overall_text("Download stopped")
+                    self.progress_tracker.update_current_progress("Stopped")
+                    self.ui.set_download_buttons_state(download_enabled=True, stop_enabled=False)
+                    self.ui.log_message("❌ Download stopped by user")
+                
                 elif message_type == "error":
                     self.ui.log_message(f"❌ Error: {data[0]}")
                     self.ui.set_download_buttons_state(download_enabled=True, stop_enabled=False)
-                
-                # Limit processing to avoid UI freezing
-                if message_count >= 50:
-                    break
                     
         except queue.Empty:
             pass
         
-        # Schedule next update
-        self.root.after(MESSAGE_UPDATE_INTERVAL, self.update_messages)
+        self._apply_pending_updates(log_lines, latest_video, latest_current, latest_overall)
+        return message_count
+    
+    def _apply_pending_updates(self, log_lines, latest_video, latest_current, latest_overall):
+        """Apply the log lines and progress updates coalesced by update_messages"""
+        if log_lines:
+            self.ui.log_messages(log_lines)
+            log_lines.clear()
+        
+        if latest_current is not None:
+            self.progress_tracker.update_current_progress(*latest_current)
+        
+        if latest_video:
+            # The tracker writes the rows and the overall progress once Tk is idle
+            for url, fields in latest_video.items():
+                self.progress_tracker.update_video_progress(url=url, **fields)
+            latest_video.clear()
+        
+        if latest_overall is not None:
+            self.progress_tracker.set_overall_text(latest_overall)
     
     def _handle_download_completion(self, completion_data):
         """Handle download completion"""
@@ -205,8 +334,8 @@ class YouTubeDownloaderGUI:
         self.ui.set_download_buttons_state(download_enabled=True, stop_enabled=False)
         
         # Update progress display
-        self.progress_tracker.overall_progress_var.set(f"✅ Complete: {successful}/{total} successful")
-        self.progress_tracker.current_progress_var.set("Download completed")
+        self.progress_tracker.set_overall_text(f"✅ Complete: {successful}/{total} successful")
+        self.progress_tracker.update_current_progress("Download completed")
         
         # Log completion
         if failed > 0:
@@ -240,6 +369,8 @@ class YouTubeDownloaderGUI:
 
 def main():
     """Main function for GUI"""
+    # Debug output is opt-in: raise the level to DEBUG to see it
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
     try:
         app = YouTubeDownloaderGUI()
         app.run()
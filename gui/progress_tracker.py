@@ -3,9 +3,31 @@ Progress tracking functionality for the YouTube Downloader GUI
 Handles video progress tracking, overall progress calculation, and UI updates
 """
 
+import re
+import time
+import threading
+import functools
+import logging
 import tkinter as tk
 from tkinter import ttk
-from .constants import PROGRESS_COLUMNS, PROGRESS_COLUMN_WIDTHS
+from .constants import (
+    PROGRESS_COLUMNS, PROGRESS_COLUMN_WIDTHS, PROGRESS_STATUS_COLORS, PROGRESS_ROW_MIN_INTERVAL,
+    PROGRESS_TICK_INTERVAL
+)
+
+logger = logging.getLogger(__name__)
+
+# YouTube video ID in watch, short-link, embed and shorts URLs
+_YT_ID_RE = re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/shorts/)([A-Za-z0-9_-]{11})')
+
+
+def _truncate(title):
+    """Shorten title to fit the compact Title column"""
+    return title[:40] + "..." if len(title) > 40 else title
+
+
+# Statuses that count a video as done in the overall progress
+FINAL_STATUSES = frozenset(("Completed", "Failed"))
 
 
 class ProgressTracker:
@@ -21,193 +43,340 @@ class ProgressTracker:
         
         # Progress tracking data
         self.video_progress = {}
+        # YouTube video ID -> tracked URL, for matching URL variants in O(1)
+        self._id_to_url = {}
+        # Number of tracked videos whose status is in FINAL_STATUSES
+        self._completed_count = 0
         self.current_video_index = 0
         self.total_videos = 0
         
-        # Setup tree columns if tree is available
-        if self.videos_tree:
-            self._setup_tree_columns()
+        # Tree rows waiting to be written: item_id -> values. Flushed together
+        # from an after_idle callback so a burst of updates costs one pass.
+        self._pending = {}
+        self._flush_scheduled = False
+        self._see_item = None
+        
+        # item_id -> monotonic time the row's values were last queued, and the
+        # rows with a dropped percentage waiting to be written (see
+        # _flush_dropped_progress)
+        self._last_flush = {}
+        self._trailing_flush = set()
+        
+        # Latest progress bar values and labels. The update_* methods only record
+        # them here; _tick pushes whatever changed into the widgets.
+        self._latest_lock = threading.Lock()
+        self._latest = {
+            "overall": 0.0,
+            "overall_text": "Ready",
+            "current": 0.0,
+            "current_text": "No active download"
+        }
+        self._applied = {}
     
     def _setup_tree_columns(self):
-        """Configure the progress tree columns"""
+        """Configure the progress tree columns (called by UIComponents once the tree exists)"""
         # Configure column headings and widths
         for col in PROGRESS_COLUMNS:
             self.videos_tree.heading(col, text=col if col != "Index" else "#")
             width = PROGRESS_COLUMN_WIDTHS[col]
             anchor = "center" if col in ["Index", "Status", "Progress"] else "w"
             self.videos_tree.column(col, width=width, anchor=anchor)
+        
+        # Rows are colored through their status tag, configured once here
+        for status, color in PROGRESS_STATUS_COLORS.items():
+            self.videos_tree.tag_configure(status, background=color)
     
     def clear_video_progress(self):
         """Clear the video progress tree and reset tracking data"""
-        for item in self.videos_tree.get_children():
-            self.videos_tree.delete(item)
+        self.videos_tree.delete(*self.videos_tree.get_children())
+        self._pending.clear()
+        self._last_flush.clear()
+        self._trailing_flush.clear()
+        self._id_to_url.clear()
+        self._completed_count = 0
         self.video_progress = {}
         self.current_video_index = 0
         self.total_videos = 0
     
     def add_video_to_progress(self, index, title, url):
         """Add a video to the progress tracking tree"""
-        print(f"[PROGRESS DEBUG] add_video_to_progress called:")
-        print(f"  Index: {index}")
-        print(f"  Title: {title}")
-        print(f"  URL: {url}")
+        logger.debug("add_video_to_progress: index=%s title=%s url=%s", index, title, url)
         
         # Check if this URL is already being tracked (avoid duplicates)
-        if url in self.video_progress:
-            print(f"[PROGRESS DEBUG] URL already exists in progress tracking, skipping: {url}")
-            return self.video_progress[url]["item_id"]
+        existing = self.video_progress.get(url)
+        if existing is not None:
+            logger.debug("URL already exists in progress tracking, skipping: %s", url)
+            return existing["item_id"]
+        
+        item_id = self._insert_video_row(index, title, url)
+        
+        logger.debug("Video added to progress tracking: item=%s total=%s", item_id, len(self.video_progress))
         
+        return item_id
+    
+    def add_videos_bulk(self, items):
+        """Add several (index, title, url) videos to the progress tree at once
+        
+        Rows are inserted back to back without per-row debug output; Tk redraws
+        the tree once when it next goes idle.
+        """
+        added = 0
+        for index, title, url in items:
+            if url not in self.video_progress:
+                self._insert_video_row(index, title, url)
+                added += 1
+        
+        logger.debug("%s videos added, total videos in tracking: %s", added, len(self.video_progress))
+    
+    def _insert_video_row(self, index, title, url):
+        """Insert a Pending row for url and start tracking it"""
         # For playlist videos, don't use the total_videos in the display index
         display_index = str(index) if isinstance(index, str) else f"{index}"
         
         # Compact display with shorter title
-        display_title = title[:40] + "..." if len(title) > 40 else title
+        display_title = _truncate(title)
         
-        item_id = self.videos_tree.insert("", "end", values=(
-            display_index,
-            display_title,
-            "Pending",
-            "0%"
-        ))
+        values = (display_index, display_title, "Pending", "0%")
+        item_id = self.videos_tree.insert("", "end", values=values)
         
         self.video_progress[url] = {
             "item_id": item_id,
             "index": index,
             "title": title,
+            "display_title": display_title,
             "status": "Pending",
-            "progress": 0
+            "progress": 0,
+            # Set while a rate-limited percentage hasn't reached the row values
+            "progress_pending": False,
+            # Row values as last built, and as last written to the tree
+            "values": values,
+            "applied_values": values
         }
-        
-        print(f"[PROGRESS DEBUG] Video added to progress tracking:")
-        print(f"  Item ID: {item_id}")
-        print(f"  Total videos in tracking: {len(self.video_progress)}")
-        
+        video_id = self._extract_video_id(url)
+        if video_id:
+            self._id_to_url.setdefault(video_id, url)
         return item_id
     
     def update_video_progress(self, url, status=None, progress=None, quality=None, title=None):
         """Update progress for a specific video"""
-        print(f"[PROGRESS DEBUG] update_video_progress called:")
-        print(f"  URL: {url}")
-        print(f"  Status: {status}")
-        print(f"  Progress: {progress}")
-        print(f"  Quality: {quality}")
-        print(f"  Title: {title}")
+        logger.debug("update_video_progress: url=%s status=%s progress=%s quality=%s title=%s",
+                     url, status, progress, quality, title)
         
         # Find the video entry (with URL matching logic)
         video_info = self._find_video_by_url(url)
         if not video_info:
-            print(f"[PROGRESS DEBUG] No matching URL found for: {url}")
+            logger.debug("No matching URL found for: %s", url)
             return
         
         item_id = video_info["item_id"]
         
+        # Only a title that differs from the stored one needs re-truncating
+        title_changed = bool(title) and title != video_info["title"]
+        
+        # Rate-limit percentage-only updates per row; status transitions and
+        # title changes are never dropped
+        now = time.monotonic()
+        if (progress is not None and status in (None, video_info["status"]) and not title_changed
+                and now - self._last_flush.get(item_id, 0.0) < PROGRESS_ROW_MIN_INTERVAL):
+            # Keep the latest value and write it once the interval is up, so the
+            # row doesn't stay on an older percentage if the burst ends here
+            video_info["progress"] = progress
+            video_info["progress_pending"] = True
+            if item_id not in self._trailing_flush:
+                self._trailing_flush.add(item_id)
+                self.videos_tree.after(int(PROGRESS_ROW_MIN_INTERVAL * 1000),
+                                       self._flush_dropped_progress, url)
+            return
+        self._last_flush[item_id] = now
+        
         # Update stored information
         if status:
+            # Keep the completed count in step with status transitions
+            was_final = video_info["status"] in FINAL_STATUSES
+            is_final = status in FINAL_STATUSES
+            if is_final and not was_final:
+                self._completed_count += 1
+            elif was_final and not is_final:
+                self._completed_count -= 1
             video_info["status"] = status
         if progress is not None:
             video_info["progress"] = progress
-        if title:
+        if title_changed:
             video_info["title"] = title
+            video_info["display_title"] = _truncate(title)
         
-        # Update the tree item
+        # Build the new row values from the cached ones - no need to read them
+        # back from the tree; the tree is written by _flush_pending
         try:
-            current_values = list(self.videos_tree.item(item_id)["values"])
-            print(f"[PROGRESS DEBUG] Current tree values: {current_values}")
+            current_values = list(video_info["values"])
+            logger.debug("Current tree values: %s", current_values)
             
             # Update values for compact format (4 columns)
-            if title:
-                current_values[1] = title[:40] + "..." if len(title) > 40 else title
+            if title_changed:
+                current_values[1] = video_info["display_title"]
             if status:
                 current_values[2] = status
-            if progress is not None:
+            # A percentage dropped by the rate limit is folded in too, so a
+            # status-only update doesn't carry an older one forward
+            if progress is not None or video_info["progress_pending"]:
+                video_info["progress_pending"] = False
+                progress = video_info["progress"]
                 if isinstance(progress, (int, float)):
                     current_values[3] = f"{progress:.1f}%"
                 else:
                     current_values[3] = str(progress)
                 
-            print(f"[PROGRESS DEBUG] New tree values: {current_values}")
-            self.videos_tree.item(item_id, values=current_values)
+            logger.debug("New tree values: %s", current_values)
+            video_info["values"] = tuple(current_values)
+            if video_info["values"] == video_info["applied_values"] and item_id not in self._pending:
+                return
+            self._pending[item_id] = video_info
             
-            # Scroll to current item if it's being downloaded
+            # Remember the row to scroll to if it's being downloaded
             if status in ["Downloading", "Processing"]:
-                self.videos_tree.see(item_id)
-                
-            print(f"[PROGRESS DEBUG] Tree item updated successfully")
+                self._see_item = item_id
+            
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                self.videos_tree.after_idle(self._flush_pending)
             
         except Exception as e:
-            print(f"[PROGRESS DEBUG ERROR] Failed to update tree item: {e}")
+            logger.warning("Failed to update tree item: %s", e)
+    
+    def _flush_dropped_progress(self, url):
+        """Write a row's last rate-limited percentage unless a later update already has"""
+        video_info = self._find_video_by_url(url)
+        if not video_info:
+            return
+        item_id = video_info["item_id"]
+        self._trailing_flush.discard(item_id)
+        if video_info["progress_pending"]:
+            # The interval is up; don't let the rate limit drop this one too
+            self._last_flush.pop(item_id, None)
+            self.update_video_progress(url, progress=video_info["progress"])
+    
+    def _flush_pending(self):
+        """Write all pending row updates to the tree and refresh the overall progress once"""
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        see_item, self._see_item = self._see_item, None
+        
+        for item_id, video_info in pending.items():
+            values = video_info["values"]
+            if values == video_info["applied_values"]:
+                continue
+            try:
+                # A single changed cell (usually the percentage) is written on
+                # its own; several changes at once rewrite the whole row.
+                # A status change also retags the row in the same call
+                changed = [i for i, (new, old) in enumerate(zip(values, video_info["applied_values"]))
+                           if new != old]
+                if values[2] != video_info["applied_values"][2]:
+                    self.videos_tree.item(item_id, values=values, tags=(values[2],))
+                elif len(changed) == 1:
+                    column = changed[0]
+                    self.videos_tree.set(item_id, PROGRESS_COLUMNS[column], values[column])
+                else:
+                    self.videos_tree.item(item_id, values=values)
+                video_info["applied_values"] = values
+            except tk.TclError as e:
+                # The row was removed since the update was queued
+                logger.warning("Failed to update tree item: %s", e)
+        
+        # Scroll to the last row that started downloading, once per flush
+        if see_item is not None and see_item in pending:
+            try:
+                self.videos_tree.see(see_item)
+            except tk.TclError:
+                pass
+        
+        if pending:
+            self.update_overall_progress()
     
     def _find_video_by_url(self, url):
         """Find video entry by URL with fuzzy matching for URL variations"""
         # Check for exact URL match first
         if url in self.video_progress:
             video_info = self.video_progress[url]
-            print(f"[PROGRESS DEBUG] Found exact URL match")
+            logger.debug("Found exact URL match")
             return video_info
         
         # Check for URL variants (with/without parameters, different formats)
-        print(f"[PROGRESS DEBUG] No exact URL match found. Checking variants...")
-        print(f"[PROGRESS DEBUG] Available URLs in tracking: {len(self.video_progress)} total")
-        
-        for key in self.video_progress.keys():
-            if self._urls_match(url, key):
-                print(f"[PROGRESS DEBUG] Found URL match by video ID")
-                return self.video_progress[key]
+        # by their video ID
+        key = self._id_to_url.get(self._extract_video_id(url))
+        if key is not None:
+            logger.debug("Found URL match by video ID")
+            return self.video_progress[key]
         
         return None
     
-    def _urls_match(self, url1, url2):
-        """Check if two URLs refer to the same video by comparing video IDs"""
-        try:
-            # Extract video IDs from both URLs
-            id1 = self._extract_video_id(url1)
-            id2 = self._extract_video_id(url2)
-            return id1 == id2 if id1 and id2 else False
-        except Exception as e:
-            print(f"[PROGRESS DEBUG] Error comparing URLs: {e}")
-            return False
-    
-    def _extract_video_id(self, url):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_video_id(url):
         """Extract YouTube video ID from URL"""
-        try:
-            if 'youtube.com/watch?v=' in url:
-                return url.split('watch?v=')[1].split('&')[0]
-            elif 'youtu.be/' in url:
-                return url.split('youtu.be/')[1].split('?')[0]
-            return None
-        except Exception:
-            return None
+        match = _YT_ID_RE.search(url)
+        return match.group(1) if match else None
     
     def update_overall_progress(self):
         """Update overall progress based on individual video progress"""
         if not self.video_progress:
             return
             
-        completed = sum(1 for v in self.video_progress.values() 
-                       if v["status"] in ["Completed", "Failed"])
+        completed = self._completed_count
         total = len(self.video_progress)
         
         if total > 0:
             percentage = (completed / total) * 100
-            self.overall_progress_bar["value"] = percentage
             
             # More concise progress display
             status_emoji = "✅" if completed == total else "⏳"
-            self.overall_progress_var.set(f"{status_emoji} {completed}/{total} ({percentage:.0f}%)")
+            with self._latest_lock:
+                # Rounded so the ticker skips redraws for changes nobody can see
+                self._latest["overall"] = round(percentage, 1)
+                self._latest["overall_text"] = f"{status_emoji} {completed}/{total} ({percentage:.0f}%)"
             
-            print(f"[PROGRESS DEBUG] Overall progress updated: {completed}/{total} = {percentage:.1f}%")
+            logger.debug("Overall progress updated: %s/%s = %.1f%%", completed, total, percentage)
+    
+    def set_overall_text(self, text):
+        """Set the overall progress label"""
+        with self._latest_lock:
+            self._latest["overall_text"] = text
     
     def update_current_progress(self, text, progress=None):
         """Update the current video progress display"""
-        self.current_progress_var.set(text)
-        if progress is not None:
-            self.current_progress_bar["value"] = progress
+        with self._latest_lock:
+            self._latest["current_text"] = text
+            if progress is not None:
+                self._latest["current"] = round(progress, 1)
     
     def reset_progress_bars(self):
         """Reset all progress bars to initial state"""
         self.overall_progress_bar["maximum"] = 100
-        self.overall_progress_bar["value"] = 0
         self.current_progress_bar["maximum"] = 100
-        self.current_progress_bar["value"] = 0
-        self.overall_progress_var.set("Ready")
-        self.current_progress_var.set("No active download")
+        with self._latest_lock:
+            self._latest.update(overall=0.0, overall_text="Ready",
+                                current=0.0, current_text="No active download")
+    
+    def start_ticker(self):
+        """Start refreshing the progress bars and labels; call once the widgets exist"""
+        self._tick()
+    
+    def _tick(self):
+        """Push progress values that changed since the last tick into the widgets"""
+        with self._latest_lock:
+            latest = dict(self._latest)
+        
+        for key, value in latest.items():
+            if self._applied.get(key) == value:
+                continue
+            if key == "overall":
+                self.overall_progress_bar["value"] = value
+            elif key == "overall_text":
+                self.overall_progress_var.set(value)
+            elif key == "current":
+                self.current_progress_bar["value"] = value
+            else:
+                self.current_progress_var.set(value)
+        self._applied = latest
+        
+        self.overall_progress_bar.after(PROGRESS_TICK_INTERVAL, self._tick)
@@ -3,12 +3,15 @@ UI Components for the YouTube Downloader GUI
 Handles the creation and setup of all UI elements
 """
 
+import queue
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
+from tkinter import font as tkfont
 from .constants import (
     QUALITY_OPTIONS, DEFAULT_CUSTOM_FORMAT, FORMAT_HELP_TEXT,
     TITLE_FONT, NORMAL_FONT, BOLD_FONT, CODE_FONT, URL_FONT,
-    PROGRESS_COLUMNS, PADDING_STANDARD, PADDING_SMALL
+    PROGRESS_COLUMNS, PADDING_STANDARD, PADDING_SMALL,
+    LOG_FLUSH_INTERVAL, MAX_LOG_LINES_PER_FLUSH
 )
 
 
@@ -26,6 +29,13 @@ class UIComponents:
         self.download_subtitles_var = None
         self.embed_subtitles_var = None
         
+        # Format string for the current quality selection, refreshed when the
+        # selection or the custom format changes
+        self._cached_format = QUALITY_OPTIONS["Best Quality (4K/1440p/1080p)"]
+        
+        # Log lines waiting to be written; safe to fill from any thread
+        self._log_queue = queue.SimpleQueue()
+        
         # UI Elements
         self.urls_text = None
         self.log_text = None
@@ -44,6 +54,7 @@ class UIComponents:
     
     def setup_ui(self, download_path, browse_callback, clear_callback, quality_change_callback):
         """Setup all UI components"""
+        self._create_fonts()
         self._setup_title()
         self._setup_settings_panel(download_path, browse_callback)
         self._setup_options_panel(quality_change_callback)
@@ -53,10 +64,18 @@ class UIComponents:
         self._setup_progress_panel()
         self._setup_log_panel()
     
+    def _create_fonts(self):
+        """Create the fonts shared by all widgets, so Tk resolves each only once"""
+        self._title_font = tkfont.Font(self.parent, font=TITLE_FONT)
+        self._normal_font = tkfont.Font(self.parent, font=NORMAL_FONT)
+        self._bold_font = tkfont.Font(self.parent, font=BOLD_FONT)
+        self._code_font = tkfont.Font(self.parent, font=CODE_FONT)
+        self._url_font = tkfont.Font(self.parent, font=URL_FONT)
+    
     def _setup_title(self):
         """Setup the title label"""
         title_label = ttk.Label(self.main_container, text="🎬 YouTube Downloader", 
-                               font=TITLE_FONT)
+                               font=self._title_font)
         title_label.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, PADDING_STANDARD))
     
     def _setup_settings_panel(self, download_path, browse_callback):
@@ -109,6 +128,7 @@ class UIComponents:
         self.custom_format_var = tk.StringVar(value=DEFAULT_CUSTOM_FORMAT)
         self.custom_format_entry = ttk.Entry(self.custom_format_frame, textvariable=self.custom_format_var)
         self.custom_format_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 5))
+        self.custom_format_var.trace_add('write', lambda *args: self._refresh_cached_format())
         
         help_button = ttk.Button(self.custom_format_frame, text="?", width=3, 
                                command=self._show_format_help)
@@ -124,7 +144,7 @@ class UIComponents:
         urls_panel.columnconfigure(0, weight=1)
         urls_panel.rowconfigure(0, weight=1)
         
-        self.urls_text = scrolledtext.ScrolledText(urls_panel, height=4, width=50, font=URL_FONT)
+        self.urls_text = scrolledtext.ScrolledText(urls_panel, height=4, width=50, font=self._url_font)
         self.urls_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
     
     def _setup_buttons_panel(self, clear_callback):
@@ -162,9 +182,9 @@ class UIComponents:
         overall_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, PADDING_SMALL))
         overall_frame.columnconfigure(1, weight=1)
         
-        ttk.Label(overall_frame, text="Overall:", font=BOLD_FONT).grid(row=0, column=0, sticky=tk.W)
+        ttk.Label(overall_frame, text="Overall:", font=self._bold_font).grid(row=0, column=0, sticky=tk.W)
         overall_label = ttk.Label(overall_frame, textvariable=self.progress_tracker.overall_progress_var, 
-                                 font=NORMAL_FONT)
+                                 font=self._normal_font)
         overall_label.grid(row=0, column=1, sticky=tk.W, padx=(PADDING_STANDARD, 0))
         
         overall_progress_bar.grid(row=1, column=0, sticky=(tk.W, tk.E), 
@@ -180,6 +200,9 @@ class UIComponents:
         # Configure tree in progress tracker
         self.progress_tracker._setup_tree_columns()
         
+        # Progress bars and labels are refreshed on a timer from here on
+        self.progress_tracker.start_ticker()
+        
         # Treeview with scrollbar
         tree_frame = ttk.Frame(progress_panel)
         tree_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -197,9 +220,9 @@ class UIComponents:
         current_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=(PADDING_SMALL, 0))
         current_frame.columnconfigure(1, weight=1)
         
-        ttk.Label(current_frame, text="Current:", font=BOLD_FONT).grid(row=0, column=0, sticky=tk.W)
+        ttk.Label(current_frame, text="Current:", font=self._bold_font).grid(row=0, column=0, sticky=tk.W)
         current_label = ttk.Label(current_frame, textvariable=self.progress_tracker.current_progress_var, 
-                                 font=NORMAL_FONT)
+                                 font=self._normal_font)
         current_label.grid(row=0, column=1, sticky=tk.W, padx=(PADDING_STANDARD, 0))
         
         current_progress_bar.grid(row=4, column=0, sticky=(tk.W, tk.E), 
@@ -213,8 +236,11 @@ class UIComponents:
         log_panel.rowconfigure(0, weight=1)
         
         self.log_text = scrolledtext.ScrolledText(log_panel, height=6, width=50, 
-                                                 font=CODE_FONT, wrap=tk.WORD)
+                                                 font=self._code_font, wrap=tk.WORD)
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Start writing queued log lines
+        self._drain_log()
     
     def _show_format_help(self):
         """Show help dialog for custom format"""
@@ -226,14 +252,19 @@ class UIComponents:
             self.custom_format_frame.grid()
         else:
             self.custom_format_frame.grid_remove()
+        self._refresh_cached_format()
     
     def get_selected_format(self):
         """Get the currently selected video format"""
+        return self._cached_format
+    
+    def _refresh_cached_format(self):
+        """Recompute the format string returned by get_selected_format"""
         quality_name = self.quality_var.get()
         if quality_name == "Custom Format":
-            return self.custom_format_var.get()
+            self._cached_format = self.custom_format_var.get()
         else:
-            return QUALITY_OPTIONS.get(quality_name, "bestvideo[ext=mp4]+bestaudio[ext=m4a]/bestvideo+bestaudio/best")
+            self._cached_format = QUALITY_OPTIONS.get(quality_name, "bestvideo[ext=mp4]+bestaudio[ext=m4a]/bestvideo+bestaudio/best")
     
     def clear_urls(self):
         """Clear the URLs text area"""
@@ -244,12 +275,36 @@ class UIComponents:
         return self.urls_text.get(1.0, tk.END).strip()
     
     def log_message(self, message):
-        """Add message to log"""
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
+        """Add message to log (written by the next _drain_log)"""
+        self._log_queue.put(message)
+    
+    def log_messages(self, messages):
+        """Add several messages to log"""
+        for message in messages:
+            self._log_queue.put(message)
+    
+    def _drain_log(self):
+        """Write queued log lines with a single insert and scroll, then reschedule"""
+        lines = []
+        try:
+            while len(lines) < MAX_LOG_LINES_PER_FLUSH:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if lines:
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            self.log_text.see(tk.END)
+        
+        self.log_text.after(LOG_FLUSH_INTERVAL, self._drain_log)
     
     def clear_log(self):
-        """Clear the log text area"""
+        """Clear the log text area, dropping lines not written yet"""
+        try:
+            while True:
+                self._log_queue.get_nowait()
+        except queue.Empty:
+            pass
         self.log_text.delete(1.0, tk.END)
     
     def set_download_buttons_state(self, download_enabled, stop_enabled):
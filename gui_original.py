@@ -7,13 +7,14 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
 import threading
 import queue
-import sys
 import subprocess
 import signal
 import os
 import time
-import traceback
-from pathlib import Path
+import logging
+import re
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
 try:
     import psutil
     PSUTIL_AVAILABLE = True
@@ -24,11 +25,100 @@ try:
     import yt_dlp
 except ImportError:
     print("Error: yt-dlp not installed. Please run: pip install -r requirements.txt")
-    sys.exit(1)
+    yt_dlp = None
 
 # Import our YouTube downloader
 from youtube_downloader import YouTubeDownloader
 
+logger = logging.getLogger(__name__)
+
+# Subtitle file extensions whose progress events are not shown in the GUI
+SUBTITLE_EXTENSIONS = ('.srt', '.vtt', '.ass')
+
+# Number of videos downloaded at the same time. Past about a dozen streams
+# the extra connections just compete for CPU and bandwidth.
+DEFAULT_PARALLEL_DOWNLOADS = 4
+MAX_PARALLEL_DOWNLOADS = 12
+
+# Minimum time (seconds) between "downloading" progress messages for one URL
+PROGRESS_EMIT_INTERVAL = 0.1
+
+# Titles of the placeholder entries a flat playlist extraction returns for
+# private and deleted videos
+UNAVAILABLE_ENTRY_TITLES = frozenset({'[Private video]', '[Deleted video]'})
+
+# Hosts accepted as YouTube URLs
+_YT_HOST_RE = re.compile(r'(?:youtube\.com|youtu\.be)', re.IGNORECASE)
+
+_KB = 1 << 10
+_MB = 1 << 20
+
+
+def classify_download_error(error_msg):
+    """Map a yt-dlp error message to a (status, friendly message) pair"""
+    if "Private video" in error_msg:
+        return "Private/Restricted", "❌ Private/Restricted content - Authentication required"
+    elif "Video unavailable" in error_msg:
+        return "Unavailable", "❌ Video unavailable or deleted"
+    elif "Sign in" in error_msg:
+        return "Login Required", "❌ Login required for this content"
+    elif "cookies" in error_msg.lower():
+        return "Auth Required", "❌ Authentication required (cookies needed)"
+    elif "network" in error_msg.lower() or "connection" in error_msg.lower():
+        return "Network Error", "❌ Network connection error"
+    else:
+        return "Failed", f"❌ Download failed: {error_msg[:100]}..."
+
+
+def is_unavailable_entry(entry):
+    """Return True for a flat playlist entry that cannot be downloaded.
+    
+    extract_flat keeps private and deleted videos as placeholder stubs rather
+    than None, so they are recognised by their title or availability.
+    """
+    return (entry is None
+            or entry.get('title') in UNAVAILABLE_ENTRY_TITLES
+            or entry.get('availability') == 'private')
+
+
+def format_speed(speed):
+    """Format a download speed in bytes/s as ' at 1.2 MB/s' (empty if unknown)"""
+    if not speed or speed <= 0:
+        return ""
+    if speed > _MB:
+        return f" at {speed / _MB:.1f} MB/s"
+    if speed > _KB:
+        return f" at {speed / _KB:.1f} KB/s"
+    return f" at {speed:.0f} B/s"
+
+
+def format_eta(eta):
+    """Format an ETA in seconds as ' (ETA: m:ss)' (empty if unknown)"""
+    if not eta or eta <= 0:
+        return ""
+    minutes, seconds = divmod(int(eta), 60)
+    return f" (ETA: {minutes}:{seconds:02d})"
+
+
+class DownloadBatch:
+    """State shared by the downloads of one batch.
+    
+    Each download_worker creates its own, so a batch started right after a
+    stop never shares instances or throttling state with the one still
+    draining.
+    """
+    
+    def __init__(self):
+        # Subtitle files whose first progress event has already been reported
+        self.seen_sub_files = set()
+        
+        # Time of the last progress message sent per URL, for throttling
+        self.last_progress_emit = {}
+        
+        # YoutubeDL instances reused by the pool threads, closed when the batch ends
+        self.ydl_local = threading.local()
+        self.open_ydls = []
+
 
 class YouTubeDownloaderGUI:
     def __init__(self):
@@ -41,7 +131,14 @@ class YouTubeDownloaderGUI:
         self.root.configure(bg='#f8f9fa')
         
         # Queue for thread communication
-        self.message_queue = queue.Queue()
+        # SimpleQueue skips the task-tracking locks of queue.Queue
+        self.message_queue = queue.SimpleQueue()
+        
+        # Queue polling interval (ms), adapted to message volume in update_messages
+        self._drain_interval = 50
+        
+        # Log lines waiting to be written to the log widget on the next tick
+        self._log_buffer = []
         
         # Downloader instance
         self.downloader = None
@@ -49,9 +146,17 @@ class YouTubeDownloaderGUI:
         self.download_stopped = False  # Flag to track if download was stopped
         
         # Process tracking for proper termination
-        self.running_processes = []
+        self.running_processes = set()
         self.download_thread = None
         
+        # subprocess.run stays patched while any download in the pool is running
+        self._tracking_lock = threading.Lock()
+        self._tracking_depth = 0
+        self._original_subprocess_run = subprocess.run
+        
+        # Pool size for the current batch, read from parallel_var on start
+        self._parallel_downloads = DEFAULT_PARALLEL_DOWNLOADS
+        
         # Video progress tracking
         self.video_progress = {}
         self.current_video_index = 0
@@ -128,7 +233,14 @@ class YouTubeDownloaderGUI:
         self.embed_subtitles_var = tk.BooleanVar(value=False)
         embed_check = ttk.Checkbutton(options_panel, text="📎 Embed", 
                                      variable=self.embed_subtitles_var)
-        embed_check.grid(row=0, column=3, sticky=tk.W)
+        embed_check.grid(row=0, column=3, sticky=tk.W, padx=(0, 10))
+        
+        # Number of simultaneous downloads
+        ttk.Label(options_panel, text="⚡ Parallel:").grid(row=0, column=4, sticky=tk.W)
+        self.parallel_var = tk.IntVar(value=DEFAULT_PARALLEL_DOWNLOADS)
+        parallel_spin = ttk.Spinbox(options_panel, from_=1, to=MAX_PARALLEL_DOWNLOADS,
+                                    textvariable=self.parallel_var, width=3)
+        parallel_spin.grid(row=0, column=5, sticky=tk.W, padx=(5, 0))
         
         # Custom format entry (initially hidden)
         self.custom_format_frame = ttk.Frame(main_container)
@@ -287,6 +399,14 @@ class YouTubeDownloaderGUI:
         else:
             return self.quality_options.get(quality_name, "bestvideo[ext=mp4]+bestaudio[ext=m4a]/bestvideo+bestaudio/best")
     
+    def get_download_settings(self):
+        """Get current download settings (call from the GUI thread)"""
+        return {
+            'format': self.get_selected_format(),
+            'download_subtitles': bool(self.download_subtitles_var.get()),
+            'embed_subtitles': bool(self.embed_subtitles_var.get())
+        }
+    
     def clear_video_progress(self):
         """Clear the video progress tree"""
         for item in self.videos_tree.get_children():
@@ -297,21 +417,18 @@ class YouTubeDownloaderGUI:
     
     def add_video_to_progress(self, index, title, url):
         """Add a video to the progress tracking tree"""
-        print(f"[GUI DEBUG] add_video_to_progress called:")
-        print(f"  Index: {index}")
-        print(f"  Title: {title}")
-        print(f"  URL: {url}")
+        logger.debug("add_video_to_progress: index=%s title=%s url=%s", index, title, url)
         
         # Check if this URL is already being tracked (avoid duplicates)
         if url in self.video_progress:
-            print(f"[GUI DEBUG] URL already exists in progress tracking, skipping: {url}")
+            logger.debug("URL already exists in progress tracking, skipping: %s", url)
             return self.video_progress[url]["item_id"]
         
         # For playlist videos, don't use the total_videos in the display index
         # as it may not be updated yet when playlist videos are being added
         display_index = str(index) if isinstance(index, str) else f"{index}"
         
-        # Compact display with shorter title
+        # Compact display with shorter title (computed once and cached)
         display_title = title[:40] + "..." if len(title) > 40 else title
         
         item_id = self.videos_tree.insert("", "end", values=(
@@ -325,35 +442,37 @@ class YouTubeDownloaderGUI:
             "item_id": item_id,
             "index": index,
             "title": title,
+            "display_title": display_title,
             "status": "Pending",
+            "last_seen_status": "Pending",
             "progress": 0
         }
         
-        print(f"[GUI DEBUG] Video added to progress tracking:")
-        print(f"  Item ID: {item_id}")
-        print(f"  Total videos in tracking: {len(self.video_progress)}")
+        logger.debug("Video added to progress tracking: item_id=%s total=%d",
+                     item_id, len(self.video_progress))
         
         return item_id
     
+    def add_videos_to_progress_batch(self, videos):
+        """Add several videos (dicts with index, title and url) to the progress tree"""
+        # All inserts happen in one tick, so Tk redraws the tree once for the batch
+        for video in videos:
+            self.add_video_to_progress(video["index"], video["title"], video["url"])
+    
     def update_video_progress(self, url, status=None, progress=None, quality=None, title=None):
         """Update progress for a specific video"""
-        # Debug logging
-        print(f"[GUI DEBUG] update_video_progress called:")
-        print(f"  URL: {url}")
-        print(f"  Status: {status}")
-        print(f"  Progress: {progress}")
-        print(f"  Quality: {quality}")
-        print(f"  Title: {title}")
+        logger.debug("update_video_progress: url=%s status=%s progress=%s quality=%s title=%s",
+                     url, status, progress, quality, title)
         
         # Check for exact URL match first
         if url in self.video_progress:
             video_info = self.video_progress[url]
             item_id = video_info["item_id"]
-            print(f"[GUI DEBUG] Found exact URL match, item_id: {item_id}")
+            logger.debug("Found exact URL match, item_id: %s", item_id)
         else:
             # Check for URL variants (with/without parameters, different formats)
-            print(f"[GUI DEBUG] No exact URL match found. Checking variants...")
-            print(f"[GUI DEBUG] Available URLs in tracking: {len(self.video_progress)} total")
+            logger.debug("No exact URL match found, checking %d tracked URLs for variants",
+                         len(self.video_progress))
             
             matched_url = None
             for key in self.video_progress.keys():
@@ -364,7 +483,7 @@ class YouTubeDownloaderGUI:
                         key_id = key.split('watch?v=')[1].split('&')[0]
                         if url_id == key_id:
                             matched_url = key
-                            print(f"[GUI DEBUG] Found URL match by video ID: {url_id}")
+                            logger.debug("Found URL match by video ID: %s", url_id)
                             break
                     elif 'youtu.be/' in url or 'youtu.be/' in key:
                         # Handle youtu.be short URLs
@@ -380,37 +499,39 @@ class YouTubeDownloaderGUI:
                         
                         if url_id == key_id:
                             matched_url = key
-                            print(f"[GUI DEBUG] Found URL match by video ID (youtu.be): {url_id}")
+                            logger.debug("Found URL match by video ID (youtu.be): %s", url_id)
                             break
                 except Exception as e:
-                    print(f"[GUI DEBUG] Error parsing URL {key}: {e}")
+                    logger.debug("Error parsing URL %s: %s", key, e)
                     continue
             
             if matched_url:
                 url = matched_url  # Use the matched URL for the rest of the function
                 video_info = self.video_progress[url]
                 item_id = video_info["item_id"]
-                print(f"[GUI DEBUG] Using matched URL: {url}, item_id: {item_id}")
+                logger.debug("Using matched URL: %s, item_id: %s", url, item_id)
             else:
-                print(f"[GUI DEBUG] No matching URL found for: {url}")
+                logger.debug("No matching URL found for: %s", url)
                 return
         
-        # Update stored information
+        # Update stored information; only re-truncate when the title changes
+        title_changed = bool(title) and title != video_info["title"]
         if status:
             video_info["status"] = status
         if progress is not None:
             video_info["progress"] = progress
-        if title:
+        if title_changed:
             video_info["title"] = title
+            video_info["display_title"] = title[:40] + "..." if len(title) > 40 else title
         
         # Update the tree item
         try:
             current_values = list(self.videos_tree.item(item_id)["values"])
-            print(f"[GUI DEBUG] Current tree values: {current_values}")
+            logger.debug("Current tree values: %s", current_values)
             
             # Update values for compact format (4 columns instead of 5)
-            if title:
-                current_values[1] = title[:40] + "..." if len(title) > 40 else title
+            if title_changed:
+                current_values[1] = video_info["display_title"]
             if status:
                 current_values[2] = status
             if progress is not None:
@@ -420,17 +541,17 @@ class YouTubeDownloaderGUI:
                     current_values[3] = str(progress)
             # Removed quality column for compact design
                 
-            print(f"[GUI DEBUG] New tree values: {current_values}")
+            logger.debug("New tree values: %s", current_values)
             self.videos_tree.item(item_id, values=current_values)
             
-            # Scroll to current item if it's being downloaded
-            if status in ["Downloading", "Processing"]:
+            # Scroll to current item only when it first enters an active status
+            if status in ("Downloading", "Processing") and status != video_info["last_seen_status"]:
                 self.videos_tree.see(item_id)
-                
-            print(f"[GUI DEBUG] Tree item updated successfully")
+            if status:
+                video_info["last_seen_status"] = status
             
         except Exception as e:
-            print(f"[GUI DEBUG ERROR] Failed to update tree item: {e}")
+            logger.error("Failed to update tree item: %s", e)
     
     def update_overall_progress(self):
         """Update overall progress based on individual video progress"""
@@ -449,7 +570,7 @@ class YouTubeDownloaderGUI:
             status_emoji = "✅" if completed == total else "⏳"
             self.overall_progress_var.set(f"{status_emoji} {completed}/{total} ({percentage:.0f}%)")
             
-            print(f"[GUI DEBUG] Overall progress updated: {completed}/{total} = {percentage:.1f}%")
+            logger.debug("Overall progress updated: %s/%s = %.1f%%", completed, total, percentage)
     
     def browse_folder(self):
         """Browse for download folder"""
@@ -463,20 +584,38 @@ class YouTubeDownloaderGUI:
         self.urls_text.delete(1.0, tk.END)
     
     def log_message(self, message, color="black"):
-        """Add message to log"""
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """Add message to log (written out by the next update_messages tick)"""
+        self._log_buffer.append(message)
+    
+    def flush_log_buffer(self):
+        """Write all buffered log lines to the log widget in a single insert"""
+        if self._log_buffer:
+            self.log_text.insert(tk.END, "\n".join(self._log_buffer) + "\n")
+            self.log_text.see(tk.END)
+            self._log_buffer.clear()
     
     def start_download(self):
         """Start the download process in a separate thread"""
+        if yt_dlp is None:
+            messagebox.showerror("Missing Dependency",
+                               "yt-dlp is not installed. Please run: pip install -r requirements.txt")
+            return
+        
         urls_text = self.urls_text.get(1.0, tk.END).strip()
         if not urls_text:
             messagebox.showwarning("No URLs", "Please enter at least one YouTube URL")
             return
         
-        urls = [url.strip() for url in urls_text.split('\n') if url.strip()]
-        invalid_urls = [url for url in urls if 'youtube.com' not in url and 'youtu.be' not in url]
+        # Split, strip, drop repeated URLs (keeping the first occurrence) and
+        # validate in a single pass
+        seen = set()
+        urls, invalid_urls = [], []
+        for line in urls_text.splitlines():
+            url = line.strip()
+            if not url or url in seen:
+                continue
+            seen.add(url)
+            (urls if _YT_HOST_RE.search(url) else invalid_urls).append(url)
         
         if invalid_urls:
             messagebox.showwarning("Invalid URLs", 
@@ -490,9 +629,20 @@ class YouTubeDownloaderGUI:
         
         # Clear previous data
         self.log_text.delete(1.0, tk.END)
+        self._log_buffer.clear()
         self.clear_video_progress()
         self.download_stopped = False  # Reset the stop flag
         
+        # Read the pool size here - Tk variables belong to the GUI thread
+        try:
+            parallel = self.parallel_var.get()
+        except tk.TclError:
+            parallel = DEFAULT_PARALLEL_DOWNLOADS
+        self._parallel_downloads = max(1, min(MAX_PARALLEL_DOWNLOADS, parallel))
+        
+        # Snapshot the rest of the settings so the worker never touches Tcl
+        settings = self.get_download_settings()
+        
         # Initialize progress tracking
         self.total_videos = len(urls)
         self.current_video_index = 0
@@ -512,17 +662,31 @@ class YouTubeDownloaderGUI:
         # Start download thread
         self.download_thread = threading.Thread(
             target=self.download_worker, 
-            args=(urls,), 
+            args=(urls, settings), 
             daemon=True
         )
         self.download_thread.start()
     
-    def run_ytdlp_with_tracking(self, ydl_opts, url):
+    def get_shared_ydl(self, batch, ydl_opts):
+        """Return this thread's YoutubeDL for ydl_opts, creating it on first use.
+        
+        Building a YoutubeDL loads extractors and cookies, so each pool thread
+        keeps one instance per output template for the whole batch.
+        """
+        instances = getattr(batch.ydl_local, 'instances', None)
+        if instances is None:
+            instances = batch.ydl_local.instances = {}
+        
+        key = ydl_opts['outtmpl']
+        ydl = instances.get(key)
+        if ydl is None:
+            # YoutubeDL normalizes its params in place, so give it a copy
+            ydl = instances[key] = yt_dlp.YoutubeDL(ydl_opts.copy())
+            batch.open_ydls.append(ydl)
+        return ydl
+    
+    def run_ytdlp_with_tracking(self, batch, ydl_opts, url, extra_info=None):
         """Run yt-dlp download with process tracking for proper termination"""
-        import yt_dlp
-        
-        # Store the original download method
-        original_subprocess_run = subprocess.run
         
         def tracked_subprocess_run(*args, **kwargs):
             """Wrapper for subprocess.run to track processes"""
@@ -533,16 +697,15 @@ class YouTubeDownloaderGUI:
                 process = subprocess.Popen(*args, **kwargs)
                 
                 # Add to our tracking list
-                self.running_processes.append(process)
-                print(f"[GUI DEBUG] Added process {process.pid} to tracking list")
+                self.running_processes.add(process)
+                logger.debug("Added process %s to tracking list", process.pid)
                 
                 # Wait for completion and get results
                 stdout, stderr = process.communicate()
                 
                 # Remove from tracking list when done
-                if process in self.running_processes:
-                    self.running_processes.remove(process)
-                    print(f"[GUI DEBUG] Removed process {process.pid} from tracking list")
+                self.running_processes.discard(process)
+                logger.debug("Removed process %s from tracking list", process.pid)
                 
                 # Create result object similar to subprocess.run
                 class Result:
@@ -554,204 +717,439 @@ class YouTubeDownloaderGUI:
                 return Result(process.returncode, stdout, stderr)
                 
             except Exception as e:
-                print(f"[GUI DEBUG] Error in tracked subprocess: {e}")
+                logger.debug("Error in tracked subprocess: %s", e)
                 # Remove from tracking if there was an error
-                if 'process' in locals() and process in self.running_processes:
-                    self.running_processes.remove(process)
+                if 'process' in locals():
+                    self.running_processes.discard(process)
                 raise
         
-        # Monkey patch subprocess.run temporarily
-        subprocess.run = tracked_subprocess_run
+        # Monkey patch subprocess.run while any download is running. Downloads
+        # run concurrently, so only the first one in patches and the last one
+        # out restores the original.
+        with self._tracking_lock:
+            if self._tracking_depth == 0:
+                self._original_subprocess_run = subprocess.run
+                subprocess.run = tracked_subprocess_run
+            self._tracking_depth += 1
         
         try:
             # Run the download
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                result = ydl.download([url])
-            return result
+            ydl = self.get_shared_ydl(batch, ydl_opts)
+            return ydl.extract_info(url, download=True, extra_info=extra_info)
         finally:
             # Restore original subprocess.run
-            subprocess.run = original_subprocess_run
+            with self._tracking_lock:
+                self._tracking_depth -= 1
+                if self._tracking_depth == 0:
+                    subprocess.run = self._original_subprocess_run
     
-    def download_worker(self, urls):
-        """Worker function for downloading (runs in separate thread)"""
+    def progress_hook(self, batch, d):
+        """yt-dlp progress hook shared by every download in the pool"""
+        # Downloads share YoutubeDL instances, so the row to update comes from
+        # the URL each download was started with
+        video_url = d.get('info_dict', {}).get('original_url')
+        
+        # Abort this download on stop. yt-dlp lets DownloadCancelled through
+        # even with ignoreerrors, so the pool thread is freed straight away.
+        if self.download_stopped:
+            logger.debug("Download stopped flag detected in progress hook")
+            raise yt_dlp.utils.DownloadCancelled()
+        
         try:
-            import yt_dlp
-            
-            # Get selected format
-            selected_format = self.get_selected_format()
+            # Subtitle files are tiny - report the first event per file, skip the rest
+            if d['status'] == 'downloading':
+                fname = d.get('filename') or ''
+                if fname.endswith(SUBTITLE_EXTENSIONS):
+                    if fname not in batch.seen_sub_files:
+                        batch.seen_sub_files.add(fname)
+                        sub_name = fname.replace('\\', '/').split('/')[-1]
+                        self.message_queue.put(("log", f"Downloading subtitles: {sub_name}"))
+                    return
+                
+                # yt-dlp calls this for every chunk - pass on at most ~10 per second
+                # per URL; 'finished' and 'error' events always go through
+                now = time.monotonic()
+                if now - batch.last_progress_emit.get(video_url, 0.0) < PROGRESS_EMIT_INTERVAL:
+                    return
+                batch.last_progress_emit[video_url] = now
             
-            # Track current downloading URL
-            self.current_downloading_url = None
+            if __debug__:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Progress hook: status=%s file=%s downloaded=%s total=%s url=%s",
+                                 d.get('status'), d.get('filename', 'N/A'),
+                                 d.get('downloaded_bytes', 0), d.get('total_bytes', 'N/A'),
+                                 video_url)
             
-            # Create a custom progress hook
-            def progress_hook(d):
-                try:
-                    # Check if download was stopped
-                    if self.download_stopped:
-                        print(f"[DOWNLOAD DEBUG] Download stopped flag detected in progress hook")
-                        # Terminate all processes when stop is detected
-                        self.terminate_all_processes()
+            if d['status'] == 'downloading':
+                # Extract progress information
+                downloaded = d.get('downloaded_bytes', 0)
+                total = d.get('total_bytes') or d.get('total_bytes_estimate')
+                filename = d.get('filename', '')
+                
+                # Skip progress updates for audio fragments
+                if filename:
+                    if any(f'.f{i}.' in filename for i in range(100, 999)) and ('.m4a' in filename or '.webm' in filename):
+                        logger.debug("Audio fragment download detected - skipping progress update")
                         return
+                
+                # Calculate progress - handle missing total bytes
+                if total and total > 0:
+                    percent = (downloaded / total) * 100
+                    logger.debug("Calculated progress: %.1f%% (%s/%s)", percent, downloaded, total)
+                else:
+                    # For streams without total size, show activity
+                    percent = 50  # Show 50% for unknown size video downloads
+                    logger.debug("Unknown size download - using 50%% progress")
                     
-                    print(f"[DOWNLOAD DEBUG] Progress hook called:")
-                    print(f"  Status: {d.get('status')}")
-                    print(f"  Filename: {d.get('filename', 'N/A')}")
-                    print(f"  Downloaded: {d.get('downloaded_bytes', 0)}")
-                    print(f"  Total: {d.get('total_bytes', 'N/A')}")
-                    print(f"  Current downloading URL: {self.current_downloading_url}")
-                    
-                    if d['status'] == 'downloading':
-                        # Extract progress information
-                        downloaded = d.get('downloaded_bytes', 0)
-                        total = d.get('total_bytes') or d.get('total_bytes_estimate')
-                        filename = d.get('filename', '')
-                        
-                        # Skip progress updates for audio fragments and subtitle files
-                        if filename:
-                            if '.srt' in filename or '.vtt' in filename:
-                                print(f"[DOWNLOAD DEBUG] Subtitle download detected - skipping progress update")
-                                return
-                            elif any(f'.f{i}.' in filename for i in range(100, 999)) and ('.m4a' in filename or '.webm' in filename):
-                                print(f"[DOWNLOAD DEBUG] Audio fragment download detected - skipping progress update")
-                                return
-                        
-                        # Calculate progress - handle missing total bytes
-                        if total and total > 0:
-                            percent = (downloaded / total) * 100
-                            print(f"[DOWNLOAD DEBUG] Calculated progress: {percent:.1f}% ({downloaded}/{total})")
-                        else:
-                            # For streams without total size, show activity
-                            percent = 50  # Show 50% for unknown size video downloads
-                            print(f"[DOWNLOAD DEBUG] Unknown size download - using 50% progress")
-                            
-                        speed = d.get('speed', 0)
-                        eta = d.get('eta', 0)
-                        
-                        # Clean filename for display (handle both / and \ separators)
-                        if filename:
-                            display_filename = filename.replace('\\', '/').split('/')[-1]
-                        else:
-                            display_filename = 'Downloading...'
-                        
-                        # Update current video progress bar
-                        progress_data = {
-                            "percent": percent,
-                            "speed": speed,
-                            "eta": eta,
-                            "filename": display_filename
-                        }
-                        print(f"[DOWNLOAD DEBUG] Sending current_progress message: {progress_data}")
-                        self.message_queue.put(("current_progress", progress_data))
-                        
-                        # Update individual video progress if we have a current URL
-                        if self.current_downloading_url:
-                            video_progress_data = {
-                                "url": self.current_downloading_url,
-                                "progress": percent,
-                                "status": "Downloading"
-                            }
-                            print(f"[DOWNLOAD DEBUG] Sending video_progress message: {video_progress_data}")
-                            self.message_queue.put(("video_progress", video_progress_data))
-                                
-                    elif d['status'] == 'finished':
-                        filename = d.get('filename', '')
-                        print(f"[DOWNLOAD DEBUG] Download finished: {filename}")
-                        
-                        # Clean filename for display
-                        if filename:
-                            display_filename = filename.replace('\\', '/').split('/')[-1]
-                        else:
-                            display_filename = 'Processing...'
+                speed = d.get('speed', 0)
+                eta = d.get('eta', 0)
+                
+                # Clean filename for display (handle both / and \ separators)
+                if filename:
+                    display_filename = filename.replace('\\', '/').split('/')[-1]
+                else:
+                    display_filename = 'Downloading...'
+                
+                # One combined message updates both the current progress bar
+                # and the individual video row
+                progress_data = {
+                    "url": video_url,
+                    "percent": percent,
+                    "speed": speed,
+                    "eta": eta,
+                    "filename": display_filename,
+                    "status": "Downloading"
+                }
+                logger.debug("Sending progress message: %s", progress_data)
+                self.message_queue.put(("progress", progress_data))
                         
-                        # Only update video progress to "Processing" for main video files, not subtitles or audio fragments
-                        if self.current_downloading_url:
-                            if '.srt' in filename or '.vtt' in filename:
-                                print(f"[DOWNLOAD DEBUG] Subtitle finished - not updating video status")
-                                # Don't update progress for subtitles
-                            elif '.m4a' in filename or '.webm' in filename or '.mp3' in filename:
-                                print(f"[DOWNLOAD DEBUG] Audio track finished - not updating video status")
-                                # Don't update progress for audio tracks during merging
-                            elif any(f'.f{i}.' in filename for i in range(100, 999)):
-                                print(f"[DOWNLOAD DEBUG] Video/Audio fragment finished - not updating video status")
-                                # Don't update progress for individual fragments during merging
-                            else:
-                                print(f"[DOWNLOAD DEBUG] Main video finished - updating to Processing")
-                                self.message_queue.put(("video_progress", {
-                                    "url": self.current_downloading_url,
-                                    "progress": 100,
-                                    "status": "Processing"
-                                }))
-                                
-                                # Update current progress to show processing
-                                self.message_queue.put(("current_progress", {
-                                    "percent": 100,
-                                    "speed": 0,
-                                    "eta": 0,
-                                    "filename": "Processing..."
-                                }))
-                            
-                except Exception as e:
-                    print(f"[DOWNLOAD DEBUG ERROR] Progress hook error: {e}")
-                    self.message_queue.put(("log", f"Progress hook error: {e}"))
+            elif d['status'] == 'finished':
+                filename = d.get('filename', '')
+                logger.debug("Download finished: %s", filename)
+                
+                # Only update video progress to "Processing" for main video files, not subtitles or audio fragments
+                if '.srt' in filename or '.vtt' in filename:
+                    logger.debug("Subtitle finished - not updating video status")
+                    # Don't update progress for subtitles
+                elif '.m4a' in filename or '.webm' in filename or '.mp3' in filename:
+                    logger.debug("Audio track finished - not updating video status")
+                    # Don't update progress for audio tracks during merging
+                elif any(f'.f{i}.' in filename for i in range(100, 999)):
+                    logger.debug("Video/Audio fragment finished - not updating video status")
+                    # Don't update progress for individual fragments during merging
+                else:
+                    logger.debug("Main video finished - updating to Processing")
+                    self.message_queue.put(("progress", {
+                        "url": video_url,
+                        "percent": 100,
+                        "speed": 0,
+                        "eta": 0,
+                        "filename": "Processing...",
+                        "status": "Processing"
+                    }))
+                    
+        except Exception as e:
+            logger.error("Progress hook error: %s", e)
+            self.message_queue.put(("log", f"Progress hook error: {e}"))
+
+    
+    def get_download_options(self, settings, batch):
+        """Build the yt-dlp options shared by every download in a batch.
+        
+        Callers copy the result and add their own 'outtmpl'.
+        """
+        return {
+            'format': settings['format'],
+            'restrictfilenames': True,
+            'writesubtitles': settings['download_subtitles'],
+            'writeautomaticsub': settings['download_subtitles'],
+            'subtitleslangs': ['en', 'en-US', 'en-GB', 'en.*'],
+            'subtitlesformat': 'srt/vtt/best',
+            'embedsubs': settings['embed_subtitles'],
+            # Videos recorded here on an earlier run are skipped without re-downloading
+            'download_archive': os.path.join(self.download_path, '.yt-dlp-archive.txt'),
+            'ignoreerrors': True,
+            'no_warnings': True,
+            'progress_hooks': [partial(self.progress_hook, batch)],
+            'retries': 3,
+            'fragment_retries': 3,
+            'extractor_retries': 3,
+            # Enhanced quality and merging options
+            'merge_output_format': 'mp4',  # Ensure output is MP4
+            'postprocessors': [
+                {
+                    'key': 'FFmpegVideoConvertor',
+                    'preferedformat': 'mp4',
+                },
+                {
+                    'key': 'FFmpegMetadata',
+                    'add_metadata': True,
+                }
+            ],
+            'prefer_ffmpeg': True,  # Use ffmpeg for better quality
+            'keepvideo': False,  # Remove source files after merge
+            'writeinfojson': False,  # Don't write info files
+            'writethumbnail': False,  # Don't write thumbnail files
+        }
+    
+    def download_single_video(self, batch, i, total, url, video_title, ydl_opts):
+        """Download one top-level video (runs in the download pool)"""
+        if self.download_stopped:
+            return False
+        
+        try:
+            # Update status to downloading
+            logger.debug("Setting status to downloading for: %s", url)
+            self.message_queue.put(("video_progress", {
+                "url": url,
+                "status": "Downloading",
+                "progress": 0
+            }))
+            
+            logger.debug("Starting yt-dlp download...")
+            # Use tracked download method
+            self.run_ytdlp_with_tracking(batch, ydl_opts, url)
+            logger.debug("yt-dlp download completed")
+            
+            # Update video status to completed
+            logger.debug("Setting status to completed for: %s", url)
+            self.message_queue.put(("video_progress", {
+                "url": url,
+                "status": "Completed",
+                "progress": 100
+            }))
+            
+            # Also update current progress to show completion
+            self.message_queue.put(("current_progress", {
+                "percent": 100,
+                "speed": 0,
+                "eta": 0,
+                "filename": "Complete"
+            }))
+            
+            self.message_queue.put(("log", f"✓ [{i}/{total}] Completed: {video_title}"))
+            return True
+            
+        except yt_dlp.utils.DownloadCancelled:
+            self.message_queue.put(("video_progress", {"url": url, "status": "Stopped"}))
+            return False
+        except Exception as e:
+            logger.error("Exception occurred: %s", e)
+            self.report_url_failure(i, total, url, e)
+            return False
+    
+    def download_playlist_video(self, batch, j, video_url, video_title, playlist_title, ydl_opts):
+        """Download one playlist entry (runs in the download pool)"""
+        if self.download_stopped:
+            return False
+        
+        try:
+            self.message_queue.put(("video_progress", {
+                "url": video_url,
+                "status": "Downloading",
+                "progress": 0
+            }))
+            
+            # Use tracked download method
+            self.run_ytdlp_with_tracking(batch, ydl_opts, video_url, extra_info={
+                'playlist': playlist_title,
+                'playlist_index': j + 1
+            })
+            
+            # Ensure the video is marked as completed
+            logger.debug("Playlist video %s download completed successfully", j+1)
+            self.message_queue.put(("video_progress", {
+                "url": video_url,
+                "status": "Completed",
+                "progress": 100
+            }))
+            return True
+            
+        except yt_dlp.utils.DownloadCancelled:
+            self.message_queue.put(("video_progress", {"url": video_url, "status": "Stopped"}))
+            return False
+        except Exception as video_error:
+            status, _ = classify_download_error(str(video_error))
+            
+            self.message_queue.put(("video_progress", {
+                "url": video_url,
+                "status": status,
+                "progress": 0
+            }))
+            self.message_queue.put(("log", f"⚠️  Playlist video {j+1} ({video_title[:30]}...): {status}"))
+            return False
+    
+    def report_url_failure(self, i, total, url, error):
+        """Mark a top-level URL as failed and log a user-friendly reason"""
+        status, friendly_error = classify_download_error(str(error))
+        
+        # Update video status to failed
+        self.message_queue.put(("video_progress", {
+            "url": url,
+            "status": status,
+            "progress": 0
+        }))
+        
+        self.message_queue.put(("log", f"✗ [{i}/{total}] {friendly_error}"))
+    
+    def finish_playlist(self, url, playlist):
+        """Send the final status and summary for a fully processed playlist"""
+        playlist_success = playlist["success"]
+        playlist_failed = playlist["failed"]
+        available = playlist["available"]
+        unavailable_count = playlist["unavailable"]
+        
+        if playlist_success == available:
+            self.message_queue.put(("video_progress", {
+                "url": url,
+                "status": "Completed",
+                "progress": 100
+            }))
+            result = True
+        elif playlist_success > 0:
+            status_text = f"Partial ({playlist_success}/{available})"
+            if unavailable_count > 0:
+                status_text += f" +{unavailable_count} unavailable"
+            self.message_queue.put(("video_progress", {
+                "url": url,
+                "status": status_text,
+                "progress": 100
+            }))
+            result = True  # Consider partial success as success
+        else:
+            status_text = "Failed"
+            if unavailable_count > 0:
+                status_text += f" ({unavailable_count} unavailable)"
+            self.message_queue.put(("video_progress", {
+                "url": url,
+                "status": status_text,
+                "progress": 100
+            }))
+            result = False
+        
+        # Log summary
+        if playlist_success > 0:
+            self.message_queue.put(("log", f"✓ Playlist completed: {playlist_success} successful, {playlist_failed} failed"))
+        else:
+            self.message_queue.put(("log", f"✗ Playlist failed: No videos could be downloaded"))
+        
+        return result
+    
+    def download_worker(self, urls, settings):
+        """Worker function for downloading (runs in separate thread)
+        
+        Info extraction runs here one URL at a time; the downloads themselves
+        (single videos and playlist entries) are submitted to a bounded thread
+        pool so several streams are fetched at once.
+        """
+        # Instances and progress state for this batch only
+        batch = DownloadBatch()
+        try:
+            # Options every download shares, from the settings read on the GUI thread.
+            # Each output template starts from a shallow copy of this dict.
+            ydl_opts_template = self.get_download_options(settings, batch)
+            
+            # Output folders are resolved once per batch
+            playlists_dir = os.path.join(self.download_path, 'Playlists')
+            
+            # All single videos share one output template
+            single_opts = ydl_opts_template.copy()
+            single_opts['outtmpl'] = os.path.join(self.download_path, 'Single Videos', '%(title)s.%(ext)s')
             
             # Process each URL
             results = {}
-            for i, url in enumerate(urls, 1):
-                # Check if download was stopped
-                if self.download_stopped:
-                    print(f"[DOWNLOAD DEBUG] Download stopped by user")
-                    self.message_queue.put(("error", "Download was stopped by user"))
-                    return
-                
-                print(f"\n[DOWNLOAD DEBUG] ===== Processing URL {i}/{len(urls)} =====")
-                print(f"[DOWNLOAD DEBUG] URL: {url}")
-                
-                self.current_video_index = i
-                self.current_downloading_url = url
-                
-                self.message_queue.put(("overall_progress", f"Processing {i}/{len(urls)}: Extracting info..."))
+            playlists = {}  # playlist url -> success/failed/remaining counts
+            futures = {}  # future -> (parent url, kind)
+            
+            def collect(future):
+                """Record the outcome of a finished download task"""
+                parent_url, kind = futures.pop(future)
+                ok = not future.cancelled() and future.result()
                 
-                try:
-                    # Update video status to extracting info
-                    print(f"[DOWNLOAD DEBUG] Sending extracting info status for: {url}")
+                if kind == "video":
+                    results[parent_url] = ok
+                else:
+                    playlist = playlists[parent_url]
+                    playlist["success" if ok else "failed"] += 1
+                    playlist["remaining"] -= 1
+                    
+                    # Update playlist progress
+                    done = playlist["success"] + playlist["failed"]
                     self.message_queue.put(("video_progress", {
-                        "url": url,
-                        "status": "Extracting info...",
-                        "progress": 0
+                        "url": parent_url,
+                        "progress": (done / playlist["available"]) * 100,
+                        "status": f"Processing ({done}/{playlist['available']})"
                     }))
+                    if playlist["remaining"] == 0:
+                        results[parent_url] = self.finish_playlist(parent_url, playlist)
+                
+                # Update overall progress
+                self.message_queue.put(("update_overall", None))
+            
+            max_workers = self._parallel_downloads
+            logger.debug("Using %s parallel downloads", max_workers)
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for i, url in enumerate(urls, 1):
+                    # Check if download was stopped
+                    if self.download_stopped:
+                        logger.debug("Download stopped by user")
+                        executor.shutdown(cancel_futures=True)
+                        break
+                    
+                    # Pick up downloads that finished while we were extracting
+                    for future in [f for f in futures if f.done()]:
+                        collect(future)
                     
-                    # First, extract video info to get title and quality info
-                    print(f"[DOWNLOAD DEBUG] Extracting video info...")
-                    ydl_opts_info = {
-                        'quiet': True,
-                        'no_warnings': True,
-                        'extract_flat': False,
-                        'ignoreerrors': True,  # Continue processing even if some videos fail
-                        'skip_unavailable_fragments': True,  # Skip unavailable content
-                    }
+                    logger.debug("===== Processing URL %d/%d =====", i, len(urls))
+                    logger.debug("URL: %s", url)
                     
-                    with yt_dlp.YoutubeDL(ydl_opts_info) as ydl:
-                        info = ydl.extract_info(url, download=False)
-                        print(f"[DOWNLOAD DEBUG] Info extracted successfully")
+                    self.current_video_index = i
+                    
+                    self.message_queue.put(("overall_progress", f"Processing {i}/{len(urls)}: Extracting info..."))
+                    
+                    try:
+                        # Update video status to extracting info
+                        logger.debug("Sending extracting info status for: %s", url)
+                        self.message_queue.put(("video_progress", {
+                            "url": url,
+                            "status": "Extracting info...",
+                            "progress": 0
+                        }))
                         
+                        # First, extract video info to get title and quality info
+                        logger.debug("Extracting video info...")
+                        ydl_opts_info = {
+                            'quiet': True,
+                            'no_warnings': True,
+                            # Playlist entries stay unresolved (id/url/title only); each one is
+                            # fully extracted by its own download task in the pool
+                            'extract_flat': 'in_playlist',
+                            'ignoreerrors': True,  # Continue processing even if some videos fail
+                            'skip_unavailable_fragments': True,  # Skip unavailable content
+                        }
+                        
+                        with yt_dlp.YoutubeDL(ydl_opts_info) as ydl:
+                            info = ydl.extract_info(url, download=False)
+                            logger.debug("Info extracted successfully")
+                            
                         if 'entries' in info:  # Playlist
-                            print(f"[DOWNLOAD DEBUG] Detected playlist")
+                            logger.debug("Detected playlist")
                             # Handle playlist
                             playlist_title = info.get('title', f'Playlist {i}')
-                            entries = [e for e in info['entries'] if e is not None]
                             
                             # Filter out None entries and private/unavailable videos
                             available_entries = []
                             unavailable_count = 0
                             for entry in info['entries']:
-                                if entry is None:
+                                if is_unavailable_entry(entry):
                                     unavailable_count += 1
                                 else:
                                     available_entries.append(entry)
                             
                             total_entries = len(info['entries'])
-                            print(f"[DOWNLOAD DEBUG] Playlist: {playlist_title}")
-                            print(f"[DOWNLOAD DEBUG] Total entries: {total_entries}, Available: {len(available_entries)}, Unavailable: {unavailable_count}")
+                            logger.debug("Playlist: %s", playlist_title)
+                            logger.debug("Total entries: %s, Available: %s, Unavailable: %s", total_entries, len(available_entries), unavailable_count)
                             
                             if unavailable_count > 0:
                                 self.message_queue.put(("log", f"Found playlist: {playlist_title} with {total_entries} videos ({unavailable_count} private/unavailable)"))
@@ -771,185 +1169,78 @@ class YouTubeDownloaderGUI:
                                 "quality": playlist_status
                             }))
                             
-                            # Process each video in the playlist
-                            playlist_success = 0
-                            playlist_failed = 0
+                            # Queue each video in the playlist
+                            playlist = {
+                                "success": 0,
+                                "failed": 0,
+                                "remaining": 0,
+                                "available": len(available_entries),
+                                "unavailable": unavailable_count
+                            }
                             processed_videos = set()  # Track processed videos to avoid duplicates
+                            playlist_videos = []
                             for j, entry in enumerate(available_entries):
-                                # Check if download was stopped
-                                if self.download_stopped:
-                                    print(f"[DOWNLOAD DEBUG] Playlist download stopped by user")
-                                    break
+                                video_title = entry.get('title', f'Video {j+1}')
+                                video_url = entry.get('webpage_url') or entry.get('url', f'{url}#{j}')
                                 
-                                if entry:
-                                    video_title = entry.get('title', f'Video {j+1}')
-                                    video_url = entry.get('webpage_url') or entry.get('url', f'{url}#{j}')
-                                    
-                                    # Skip if already processed
-                                    if video_url in processed_videos:
-                                        print(f"[DOWNLOAD DEBUG] Skipping duplicate video: {video_url}")
-                                        continue
-                                    processed_videos.add(video_url)
-                                    
-                                    # Add to tracking - notify GUI about the new video
-                                    self.message_queue.put(("add_playlist_video", {
-                                        "index": f"{i}.{j+1}",
-                                        "title": f"  └ {video_title}",
-                                        "url": video_url
-                                    }))
-                                    
-                                    # Download individual video
-                                    self.current_downloading_url = video_url
-                                    
-                                    try:
-                                        self.message_queue.put(("video_progress", {
-                                            "url": video_url,
-                                            "status": "Downloading",
-                                            "progress": 0
-                                        }))
-                                        
-                                        # Download with progress tracking - Enhanced quality options
-                                        ydl_opts = {
-                                            'format': selected_format,
-                                            'outtmpl': str(Path(self.download_path) / 'Playlists' / f'{playlist_title}' / f'{j+1:02d} - %(title)s.%(ext)s'),
-                                            'restrictfilenames': True,
-                                            'writesubtitles': self.download_subtitles_var.get(),
-                                            'writeautomaticsub': self.download_subtitles_var.get(),
-                                            'subtitleslangs': ['en', 'en-US', 'en-GB', 'en.*'],
-                                            'subtitlesformat': 'srt/vtt/best',
-                                            'embedsubs': self.embed_subtitles_var.get(),
-                                            'ignoreerrors': True,
-                                            'no_warnings': True,
-                                            'progress_hooks': [progress_hook],
-                                            'retries': 3,
-                                            'fragment_retries': 3,
-                                            'extractor_retries': 3,
-                                            # Enhanced quality and merging options
-                                            'merge_output_format': 'mp4',  # Ensure output is MP4
-                                            'postprocessors': [
-                                                {
-                                                    'key': 'FFmpegVideoConvertor',
-                                                    'preferedformat': 'mp4',
-                                                },
-                                                {
-                                                    'key': 'FFmpegMetadata',
-                                                    'add_metadata': True,
-                                                }
-                                            ],
-                                            'prefer_ffmpeg': True,  # Use ffmpeg for better quality
-                                            'keepvideo': False,  # Remove source files after merge
-                                            'writeinfojson': False,  # Don't write info files
-                                            'writethumbnail': False,  # Don't write thumbnail files
-                                        }
-                                        
-                                        # Use tracked download method
-                                        self.run_ytdlp_with_tracking(ydl_opts, video_url)
-                                            
-                                        playlist_success += 1
-                                        
-                                        # Ensure the video is marked as completed
-                                        print(f"[DOWNLOAD DEBUG] Playlist video {j+1} download completed successfully")
-                                        self.message_queue.put(("video_progress", {
-                                            "url": video_url,
-                                            "status": "Completed",
-                                            "progress": 100
-                                        }))
-                                        
-                                    except Exception as video_error:
-                                        playlist_failed += 1
-                                        error_msg = str(video_error)
-                                        
-                                        # Provide user-friendly error messages
-                                        if "Private video" in error_msg:
-                                            friendly_error = "Private/Restricted"
-                                        elif "Video unavailable" in error_msg:
-                                            friendly_error = "Unavailable"
-                                        elif "Sign in" in error_msg:
-                                            friendly_error = "Login Required"
-                                        else:
-                                            friendly_error = "Failed"
-                                        
-                                        self.message_queue.put(("video_progress", {
-                                            "url": video_url,
-                                            "status": friendly_error,
-                                            "progress": 0
-                                        }))
-                                        self.message_queue.put(("log", f"⚠️  Playlist video {j+1} ({video_title[:30]}...): {friendly_error}"))
-                                    
-                                    # Update playlist progress
-                                    playlist_progress = ((j + 1) / len(available_entries)) * 100
-                                    self.message_queue.put(("video_progress", {
-                                        "url": url,
-                                        "progress": playlist_progress,
-                                        "status": f"Processing ({j+1}/{len(available_entries)})"
-                                    }))
+                                # Skip if already processed
+                                if video_url in processed_videos:
+                                    logger.debug("Skipping duplicate video: %s", video_url)
+                                    continue
+                                processed_videos.add(video_url)
+                                playlist_videos.append((j, video_url, video_title))
                             
-                            # Final playlist status
-                            total_processed = playlist_success + playlist_failed
-                            if playlist_success == len(available_entries):
-                                self.message_queue.put(("video_progress", {
-                                    "url": url,
-                                    "status": "Completed",
-                                    "progress": 100
-                                }))
-                                results[url] = True
-                            elif playlist_success > 0:
-                                status_text = f"Partial ({playlist_success}/{len(available_entries)})"
-                                if unavailable_count > 0:
-                                    status_text += f" +{unavailable_count} unavailable"
-                                self.message_queue.put(("video_progress", {
-                                    "url": url,
-                                    "status": status_text,
-                                    "progress": 100
-                                }))
-                                results[url] = True  # Consider partial success as success
-                            else:
-                                status_text = "Failed"
-                                if unavailable_count > 0:
-                                    status_text += f" ({unavailable_count} unavailable)"
-                                self.message_queue.put(("video_progress", {
-                                    "url": url,
-                                    "status": status_text,
-                                    "progress": 100
-                                }))
-                                results[url] = False
+                            # Add to tracking - one message adds every row of the playlist
+                            self.message_queue.put(("add_playlist_video_batch", [
+                                {
+                                    "index": f"{i}.{j+1}",
+                                    "title": f"  └ {video_title}",
+                                    "url": video_url
+                                }
+                                for j, video_url, video_title in playlist_videos
+                            ]))
                             
-                            # Log summary
-                            if playlist_success > 0:
-                                self.message_queue.put(("log", f"✓ Playlist completed: {playlist_success} successful, {playlist_failed} failed"))
-                            else:
-                                self.message_queue.put(("log", f"✗ Playlist failed: No videos could be downloaded"))
+                            # One options dict per playlist - yt-dlp fills in the index per video
+                            playlist_dir = os.path.join(playlists_dir, playlist_title)
+                            ydl_opts = ydl_opts_template.copy()
+                            ydl_opts['outtmpl'] = os.path.join(playlist_dir, '%(playlist_index)02d - %(title)s.%(ext)s')
+                            for j, video_url, video_title in playlist_videos:
+                                future = executor.submit(self.download_playlist_video, batch, j, video_url, video_title,
+                                                         playlist_title, ydl_opts)
+                                futures[future] = (url, "playlist")
+                                playlist["remaining"] += 1
+                            
+                            # Duplicates are skipped, so only count the videos actually queued
+                            playlist["available"] = playlist["remaining"]
+                            playlists[url] = playlist
+                            if playlist["remaining"] == 0:
+                                results[url] = self.finish_playlist(url, playlist)
                                 
                         else:  # Single video
-                            print(f"[DOWNLOAD DEBUG] Detected single video")
+                            logger.debug("Detected single video")
                             video_title = info.get('title', f'Video {i}')
                             formats = info.get('formats', [])
                             
-                            print(f"[DOWNLOAD DEBUG] Video title: {video_title}")
-                            print(f"[DOWNLOAD DEBUG] Available formats: {len(formats)}")
+                            logger.debug("Video title: %s", video_title)
+                            logger.debug("Available formats: %s", len(formats))
                             
                             # Find quality info - Enhanced to show more details
                             quality_info = "Unknown"
-                            best_height = 0
                             best_fps = 0
                             video_codec = "Unknown"
                             audio_codec = "Unknown"
                             
-                            for fmt in formats:
-                                height = fmt.get('height', 0)
-                                fps = fmt.get('fps', 0) or 30
-                                vcodec = fmt.get('vcodec', 'none')
-                                acodec = fmt.get('acodec', 'none')
-                                
-                                if height and height > best_height:
-                                    best_height = height
-                                    best_fps = fps
-                                    if vcodec != 'none':
-                                        video_codec = vcodec
-                                    if acodec != 'none':
-                                        audio_codec = acodec
+                            # First format with the greatest height (max keeps the first of equals)
+                            best_fmt = max(formats, key=lambda fmt: fmt.get('height') or 0, default={})
+                            best_height = best_fmt.get('height') or 0
                             
                             if best_height > 0:
+                                best_fps = best_fmt.get('fps', 0) or 30
+                                if best_fmt.get('vcodec') not in (None, 'none'):
+                                    video_codec = best_fmt['vcodec']
+                                if best_fmt.get('acodec') not in (None, 'none'):
+                                    audio_codec = best_fmt['acodec']
+                                
                                 quality_info = f"{best_height}p"
                                 if best_fps > 30:
                                     quality_info += f"@{best_fps}fps"
@@ -958,8 +1249,8 @@ class YouTubeDownloaderGUI:
                                 elif video_codec != "Unknown" and "avc1" in video_codec.lower():
                                     quality_info += " (H.264)"
                             
-                            print(f"[DOWNLOAD DEBUG] Best quality: {quality_info}")
-                            print(f"[DOWNLOAD DEBUG] Video codec: {video_codec}, Audio codec: {audio_codec}")
+                            logger.debug("Best quality: %s", quality_info)
+                            logger.debug("Video codec: %s, Audio codec: %s", video_codec, audio_codec)
                             
                             # Update video info with title and quality
                             video_update_data = {
@@ -969,125 +1260,45 @@ class YouTubeDownloaderGUI:
                                 "quality": quality_info,
                                 "progress": 0
                             }
-                            print(f"[DOWNLOAD DEBUG] Sending video update: {video_update_data}")
+                            logger.debug("Sending video update: %s", video_update_data)
                             self.message_queue.put(("video_progress", video_update_data))
-                    
-                    # For single videos, download now
-                    if 'entries' not in info:
-                        print(f"[DOWNLOAD DEBUG] Starting single video download")
-                        # Download with progress tracking - Enhanced quality options
-                        ydl_opts = {
-                            'format': selected_format,
-                            'outtmpl': str(Path(self.download_path) / 'Single Videos' / '%(title)s.%(ext)s'),
-                            'restrictfilenames': True,
-                            'writesubtitles': self.download_subtitles_var.get(),
-                            'writeautomaticsub': self.download_subtitles_var.get(),
-                            'subtitleslangs': ['en', 'en-US', 'en-GB', 'en.*'],
-                            'subtitlesformat': 'srt/vtt/best',
-                            'embedsubs': self.embed_subtitles_var.get(),
-                            'ignoreerrors': True,
-                            'no_warnings': True,
-                            'progress_hooks': [progress_hook],
-                            'retries': 3,
-                            'fragment_retries': 3,
-                            'extractor_retries': 3,
-                            # Enhanced quality and merging options
-                            'merge_output_format': 'mp4',  # Ensure output is MP4
-                            'postprocessors': [
-                                {
-                                    'key': 'FFmpegVideoConvertor',
-                                    'preferedformat': 'mp4',
-                                },
-                                {
-                                    'key': 'FFmpegMetadata',
-                                    'add_metadata': True,
-                                }
-                            ],
-                            'prefer_ffmpeg': True,  # Use ffmpeg for better quality
-                            'keepvideo': False,  # Remove source files after merge
-                            'writeinfojson': False,  # Don't write info files
-                            'writethumbnail': False,  # Don't write thumbnail files
-                        }
-                        
-                        # Update status to downloading
-                        print(f"[DOWNLOAD DEBUG] Setting status to downloading for: {url}")
-                        self.message_queue.put(("video_progress", {
-                            "url": url,
-                            "status": "Downloading",
-                            "progress": 0
-                        }))
-                        
-                        print(f"[DOWNLOAD DEBUG] Starting yt-dlp download...")
-                        # Use tracked download method
-                        self.run_ytdlp_with_tracking(ydl_opts, url)
-                        print(f"[DOWNLOAD DEBUG] yt-dlp download completed")
                             
-                        results[url] = True
-                        
-                        # Update video status to completed
-                        print(f"[DOWNLOAD DEBUG] Setting status to completed for: {url}")
-                        self.message_queue.put(("video_progress", {
-                            "url": url,
-                            "status": "Completed",
-                            "progress": 100
-                        }))
+                            # Queue the download - Enhanced quality options
+                            logger.debug("Queueing single video download")
+                            future = executor.submit(self.download_single_video, batch, i, len(urls), url,
+                                                     video_title, single_opts)
+                            futures[future] = (url, "video")
                         
-                        # Also update current progress to show completion
-                        self.message_queue.put(("current_progress", {
-                            "percent": 100,
-                            "speed": 0,
-                            "eta": 0,
-                            "filename": "Complete"
-                        }))
+                    except Exception as e:
+                        logger.error("Exception occurred: %s", e)
+                        results[url] = False
+                        self.report_url_failure(i, len(urls), url, e)
                         
-                        self.message_queue.put(("log", f"✓ [{i}/{len(urls)}] Completed: {video_title}"))
-                    
-                except Exception as e:
-                    print(f"[DOWNLOAD DEBUG ERROR] Exception occurred: {e}")
-                    results[url] = False
-                    error_msg = str(e)
-                    
-                    # Provide user-friendly error messages
-                    if "Private video" in error_msg:
-                        friendly_error = "❌ Private/Restricted content - Authentication required"
-                        status = "Private/Restricted"
-                    elif "Video unavailable" in error_msg:
-                        friendly_error = "❌ Video unavailable or deleted"
-                        status = "Unavailable"
-                    elif "Sign in" in error_msg:
-                        friendly_error = "❌ Login required for this content"
-                        status = "Login Required"
-                    elif "cookies" in error_msg.lower():
-                        friendly_error = "❌ Authentication required (cookies needed)"
-                        status = "Auth Required"
-                    elif "network" in error_msg.lower() or "connection" in error_msg.lower():
-                        friendly_error = "❌ Network connection error"
-                        status = "Network Error"
-                    else:
-                        friendly_error = f"❌ Download failed: {error_msg[:100]}..."
-                        status = "Failed"
-                    
-                    # Update video status to failed
-                    self.message_queue.put(("video_progress", {
-                        "url": url,
-                        "status": status,
-                        "progress": 0
-                    }))
-                    
-                    self.message_queue.put(("log", f"✗ [{i}/{len(urls)}] {friendly_error}"))
+                        # Update overall progress
+                        self.message_queue.put(("update_overall", None))
                 
-                # Update overall progress
-                print(f"[DOWNLOAD DEBUG] Updating overall progress")
-                self.message_queue.put(("update_overall", None))
+                # Wait for the remaining downloads
+                for future in as_completed(list(futures)):
+                    if self.download_stopped:
+                        logger.debug("Download stopped by user")
+                        executor.shutdown(cancel_futures=True)
+                        break
+                    collect(future)
+            
+            # Leaving the pool waited for the running downloads, which abort at
+            # their next progress event once the stop flag is set
+            if self.download_stopped:
+                self.message_queue.put(("stopped", None))
+                return
             
             # Send completion message
             successful = sum(1 for success in results.values() if success)
             failed = len(urls) - successful
             
-            print(f"[DOWNLOAD DEBUG] ===== DOWNLOAD COMPLETE =====")
-            print(f"[DOWNLOAD DEBUG] Successful: {successful}")
-            print(f"[DOWNLOAD DEBUG] Failed: {failed}")
-            print(f"[DOWNLOAD DEBUG] Total: {len(urls)}")
+            logger.debug("===== DOWNLOAD COMPLETE =====")
+            logger.debug("Successful: %s", successful)
+            logger.debug("Failed: %s", failed)
+            logger.debug("Total: %s", len(urls))
             
             # Final overall progress update
             self.message_queue.put(("overall_progress", f"Finalizing... {successful}/{len(urls)} completed"))
@@ -1099,71 +1310,62 @@ class YouTubeDownloaderGUI:
             }))
             
         except KeyboardInterrupt:
-            print(f"[DOWNLOAD DEBUG] Download interrupted by user")
+            logger.debug("Download interrupted by user")
             self.message_queue.put(("error", "Download was interrupted by user"))
         except Exception as e:
-            print(f"[DOWNLOAD DEBUG CRITICAL ERROR] {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Critical download error: %s", e)
             self.message_queue.put(("error", f"Download error: {e}"))
+        finally:
+            # Save cookies and release connections held by the shared instances
+            for ydl in batch.open_ydls:
+                ydl.close()
     
     def stop_download(self):
         """Stop the download process"""
-        print("[GUI DEBUG] Stop download requested")
+        logger.debug("Stop download requested")
         self.download_stopped = True
         self.overall_progress_bar.stop()
         self.current_progress_bar.stop()
         self.overall_progress_var.set("Stopping download...")
         self.current_progress_var.set("Stopping...")
         self.log_message("Stopping download...", "orange")
+        self.stop_button.config(state="disabled")
         
-        # Terminate all running processes
+        # Terminate running ffmpeg processes; downloads in progress are cancelled
+        # by progress_hook. The Download button comes back with the worker's
+        # "stopped" message, once every pool thread has finished.
         self.terminate_all_processes()
-        
-        # Wait for thread to finish gracefully (with timeout)
-        if hasattr(self, 'download_thread') and self.download_thread and self.download_thread.is_alive():
-            print("[GUI DEBUG] Waiting for download thread to finish...")
-            self.download_thread.join(timeout=3.0)  # Wait up to 3 seconds
-            
-            if self.download_thread.is_alive():
-                print("[GUI DEBUG] Download thread still running after timeout")
-                # Force thread termination if needed (not recommended but as last resort)
-        
-        # Update UI
-        self.overall_progress_var.set("Download stopped")
-        self.current_progress_var.set("Stopped")
-        self.download_button.config(state="normal")
-        self.stop_button.config(state="disabled")
-        self.log_message("Download stopped by user", "red")
-        print("[GUI DEBUG] Download stop completed")
+        logger.debug("Download stop requested, waiting for the worker to exit")
     
     def terminate_all_processes(self):
         """Terminate all running yt-dlp processes"""
         try:
-            print(f"[GUI DEBUG] Terminating {len(self.running_processes)} processes...")
+            # Download threads add and discard processes concurrently, so work on a snapshot
+            processes = list(self.running_processes)
+            logger.debug("Terminating %s processes...", len(processes))
             
             # First, try to terminate processes gracefully
-            for proc in self.running_processes[:]:  # Create a copy to iterate
+            for proc in processes:
                 try:
                     if proc.poll() is None:  # Process is still running
-                        print(f"[GUI DEBUG] Terminating process PID: {proc.pid}")
+                        logger.debug("Terminating process PID: %s", proc.pid)
                         proc.terminate()
                 except Exception as e:
-                    print(f"[GUI DEBUG] Error terminating process: {e}")
+                    logger.debug("Error terminating process: %s", e)
             
             # Wait a moment for graceful termination
             import time
             time.sleep(1)
             
             # Force kill any remaining processes
-            for proc in self.running_processes[:]:
+            for proc in processes:
                 try:
                     if proc.poll() is None:  # Still running
-                        print(f"[GUI DEBUG] Force killing process PID: {proc.pid}")
+                        logger.debug("Force killing process PID: %s", proc.pid)
                         proc.kill()
                         proc.wait(timeout=1)
                 except Exception as e:
-                    print(f"[GUI DEBUG] Error force killing process: {e}")
+                    logger.debug("Error force killing process: %s", e)
             
             # Clear the process list
             self.running_processes.clear()
@@ -1175,83 +1377,106 @@ class YouTubeDownloaderGUI:
                         try:
                             cmdline = process.info['cmdline']
                             if cmdline and any('yt-dlp' in str(arg) for arg in cmdline):
-                                print(f"[GUI DEBUG] Found and terminating yt-dlp process: {process.info['pid']}")
+                                logger.debug("Found and terminating yt-dlp process: %s", process.info['pid'])
                                 psutil.Process(process.info['pid']).terminate()
                         except (psutil.NoSuchProcess, psutil.AccessDenied):
                             pass
                 except Exception as e:
-                    print(f"[GUI DEBUG] Error searching for yt-dlp processes: {e}")
+                    logger.debug("Error searching for yt-dlp processes: %s", e)
             else:
-                print("[GUI DEBUG] psutil not available, cannot search for additional yt-dlp processes")
+                logger.debug("psutil not available, cannot search for additional yt-dlp processes")
                 
         except Exception as e:
-            print(f"[GUI DEBUG] Error in terminate_all_processes: {e}")
+            logger.debug("Error in terminate_all_processes: %s", e)
             self.running_processes.clear()  # Clear the list anyway
     
+    def show_current_progress(self, data):
+        """Update the current download progress bar and text from a progress payload"""
+        percent = data.get("percent", 0)
+        speed = data.get("speed", 0)
+        eta = data.get("eta", 0)
+        
+        logger.debug("Updating current progress: %.1f%%", percent)
+        self.current_progress_bar["value"] = percent
+        
+        progress_text = f"Downloading: {percent:.1f}%{format_speed(speed)}{format_eta(eta)}"
+        logger.debug("Setting current progress text: %s", progress_text)
+        self.current_progress_var.set(progress_text)
+    
+    def show_dialog(self, dialog, title, message):
+        """Open a messagebox once the current update_messages tick has finished.
+        
+        The dialog still runs its own modal loop, but the remaining messages,
+        progress updates and log lines are written out before it opens.
+        """
+        self.root.after(0, dialog, title, message)
+    
+    def apply_progress_updates(self, pending_progress, latest_current):
+        """Apply the progress updates coalesced by update_messages"""
+        if latest_current is not None:
+            self.show_current_progress(latest_current)
+        for url, fields in pending_progress.items():
+            self.update_video_progress(url, **fields)
+        pending_progress.clear()
+    
     def update_messages(self):
         """Process messages from download thread"""
+        message_count = 0
+        
+        # Progress messages are coalesced: rows get the latest fields per URL and
+        # the current progress bar only the newest payload, applied once per tick
+        pending_progress = {}
+        latest_current = None
         try:
-            message_count = 0
             while True:
                 message_type, data = self.message_queue.get_nowait()
                 message_count += 1
                 
-                print(f"[GUI DEBUG] Processing message {message_count}: {message_type}")
-                if isinstance(data, dict):
-                    print(f"[GUI DEBUG] Message data: {data}")
-                else:
-                    print(f"[GUI DEBUG] Message data: {str(data)[:100]}")
+                # Stripped entirely under python -O; skipped cheaply otherwise
+                if __debug__:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Processing message %s: %s", message_count, message_type)
+                        logger.debug("Message data: %s", data if isinstance(data, dict) else str(data)[:100])
                 
-                if message_type == "log":
-                    self.log_message(data)
-                elif message_type == "overall_progress":
-                    print(f"[GUI DEBUG] Updating overall progress: {data}")
-                    self.overall_progress_var.set(data)
+                if message_type == "progress":
+                    latest_current = data
+                    if data["url"]:
+                        pending_progress.setdefault(data["url"], {}).update(
+                            status=data["status"], progress=data["percent"])
+                    continue
                 elif message_type == "current_progress":
-                    percent = data.get("percent", 0)
-                    speed = data.get("speed", 0)
-                    eta = data.get("eta", 0)
-                    filename = data.get("filename", "")
-                    
-                    print(f"[GUI DEBUG] Updating current progress: {percent:.1f}%")
-                    self.current_progress_bar["value"] = percent
-                    
-                    speed_text = ""
-                    if speed is not None and speed > 0:
-                        if speed > 1024*1024:
-                            speed_text = f" at {speed/(1024*1024):.1f} MB/s"
-                        elif speed > 1024:
-                            speed_text = f" at {speed/1024:.1f} KB/s"
-                        else:
-                            speed_text = f" at {speed:.0f} B/s"
-                    
-                    eta_text = ""
-                    if eta is not None and eta > 0:
-                        eta_text = f" (ETA: {eta//60}:{eta%60:02d})"
-                    
-                    progress_text = f"Downloading: {percent:.1f}%{speed_text}{eta_text}"
-                    print(f"[GUI DEBUG] Setting current progress text: {progress_text}")
-                    self.current_progress_var.set(progress_text)
+                    latest_current = data
+                    continue
                 elif message_type == "video_progress":
-                    url = data["url"]
-                    status = data.get("status")
-                    progress = data.get("progress")
-                    quality = data.get("quality")
-                    title = data.get("title")
-                    
-                    print(f"[GUI DEBUG] Received video_progress message for URL: {url}")
-                    self.update_video_progress(url, status, progress, quality, title)
+                    pending_progress.setdefault(data["url"], {}).update(
+                        (key, value) for key, value in data.items()
+                        if key != "url" and value is not None)
+                    continue
+                elif message_type == "log":
+                    self.log_message(data)
+                    continue
+                
+                # Everything else expects the progress rows to be up to date
+                self.apply_progress_updates(pending_progress, latest_current)
+                latest_current = None
+                
+                if message_type == "overall_progress":
+                    logger.debug("Updating overall progress: %s", data)
+                    self.overall_progress_var.set(data)
                 elif message_type == "add_playlist_video":
                     index = data["index"]
                     title = data["title"]
                     url = data["url"]
-                    print(f"[GUI DEBUG] Adding playlist video: {index} - {title}")
+                    logger.debug("Adding playlist video: %s - %s", index, title)
                     self.add_video_to_progress(index, title, url)
+                elif message_type == "add_playlist_video_batch":
+                    logger.debug("Adding %d playlist videos", len(data))
+                    self.add_videos_to_progress_batch(data)
                 elif message_type == "update_overall":
-                    print(f"[GUI DEBUG] Updating overall progress bar")
+                    logger.debug("Updating overall progress bar")
                     self.update_overall_progress()
                 elif message_type == "complete":
-                    print(f"[GUI DEBUG] Download complete message received")
+                    logger.debug("Download complete message received")
                     self.overall_progress_bar.stop()
                     self.current_progress_bar["value"] = 0
                     self.current_progress_var.set("Complete")
@@ -1284,14 +1509,22 @@ class YouTubeDownloaderGUI:
                                 f"in your browser and the playlist is public or you have access."
                             )
                         
-                        messagebox.showwarning("Download Complete", failure_msg)
+                        self.show_dialog(messagebox.showwarning, "Download Complete", failure_msg)
                     else:
-                        messagebox.showinfo(
+                        self.show_dialog(
+                            messagebox.showinfo,
                             "Download Complete",
                             f"🎉 All {data['successful']} downloads completed successfully!"
                         )
+                elif message_type == "stopped":
+                    logger.debug("Download stopped message received")
+                    self.overall_progress_var.set("Download stopped")
+                    self.current_progress_var.set("Stopped")
+                    self.download_button.config(state="normal")
+                    self.stop_button.config(state="disabled")
+                    self.log_message("Download stopped by user", "red")
                 elif message_type == "error":
-                    print(f"[GUI DEBUG] Error message received: {data}")
+                    logger.debug("Error message received: %s", data)
                     self.overall_progress_bar.stop()
                     self.current_progress_bar.stop()
                     self.overall_progress_var.set("Error occurred")
@@ -1299,15 +1532,22 @@ class YouTubeDownloaderGUI:
                     self.download_button.config(state="normal")
                     self.stop_button.config(state="disabled")
                     self.log_message(f"ERROR: {data}", "red")
-                    messagebox.showerror("Download Error", data)
+                    self.show_dialog(messagebox.showerror, "Download Error", data)
                 else:
-                    print(f"[GUI DEBUG] Unknown message type: {message_type}")
+                    logger.debug("Unknown message type: %s", message_type)
                     
         except queue.Empty:
             pass
         
-        # Schedule next update
-        self.root.after(100, self.update_messages)
+        self.apply_progress_updates(pending_progress, latest_current)
+        self.flush_log_buffer()
+        
+        # Schedule next update: back off when idle, poll faster under load
+        if message_count == 0:
+            self._drain_interval = min(200, self._drain_interval * 2)
+        elif message_count > 20:
+            self._drain_interval = max(16, self._drain_interval // 2)
+        self.root.after(self._drain_interval, self.update_messages)
     
     def run(self):
         """Start the GUI application"""
@@ -1316,6 +1556,8 @@ class YouTubeDownloaderGUI:
 
 def main():
     """Main function for GUI"""
+    # Debug output is opt-in: raise the level to DEBUG to see it
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
     try:
         app = YouTubeDownloaderGUI()
         app.run()
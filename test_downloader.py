@@ -2,128 +2,281 @@
 Unit tests for YouTube Downloader
 """
 
-import unittest
-import tempfile
-import shutil
+import copy
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
+import pytest
+
 # Import the classes to test
-from youtube_downloader import YouTubeDownloader
+from youtube_downloader import YouTubeDownloader, MetadataCache, batch_main, open_metadata_cache
 
+# Characters that must never survive sanitize_filename
+_ILLEGAL_RE = re.compile(r'[<>:"/\\|?*]')
 
-class TestYouTubeDownloader(unittest.TestCase):
-    """Test cases for YouTubeDownloader class"""
+# Small extract_info result shared by the mocked yt-dlp tests
+FAKE_INFO = Path(__file__).parent / "tests" / "fixtures" / "info.json"
+
+# (input title, expected filename) pairs for test_sanitize_filename
+SANITIZE_CASES = [
+    ("Normal Title", "Normal Title"),
+    ("Title/with\\illegal:chars", "Title_with_illegal_chars"),
+    ("Title<with>more|illegal?chars*", "Title_with_more_illegal_chars_"),
+    ("   Title with spaces   ", "Title with spaces"),
+    ("x" * 201, "x" * 200),  # One byte over the 200 byte limit
+    ("é" * 101, "é" * 100),  # Two bytes per character, never split mid-character
+    ("x" + "é" * 100, "x" + "é" * 99),
+]
+
+
+def _make_ytdl_mock(info=None, exc=None):
+    """Build a mock YoutubeDL class and the instance it creates.
+    
+    The instance is returned both by the constructor (for cached instances)
+    and by its context manager. Its extract_info returns info, or raises exc
+    when one is given. Passing the class to patch() as the replacement saves
+    patch from building its own MagicMock. Returns (class mock, instance mock).
+    """
+    mock_ytdl_instance = MagicMock()
+    mock_ytdl_instance.__enter__.return_value = mock_ytdl_instance
+    mock_ytdl_instance.extract_info.return_value = info
+    mock_ytdl_instance.extract_info.side_effect = exc
+    mock_ytdl_instance.download.return_value = None
     
-    def setUp(self):
-        """Set up test environment"""
-        # Create temporary directory for tests
-        self.test_dir = tempfile.mkdtemp()
-        self.downloader = YouTubeDownloader(download_path=self.test_dir)
+    mock_ytdl = Mock(return_value=mock_ytdl_instance)
+    return mock_ytdl, mock_ytdl_instance
+
+
+@pytest.fixture(scope="session")
+def fake_info():
+    """Shared extract_info result; take a copy.deepcopy() before mutating it"""
+    with open(FAKE_INFO, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="module")
+def downloader_template(tmp_path_factory):
+    """Build one YouTubeDownloader per module instead of one per test"""
+    return YouTubeDownloader(download_path=str(tmp_path_factory.mktemp("dl")))
+
+
+class TestYouTubeDownloader:
+    """Test cases for YouTubeDownloader class"""
     
-    def tearDown(self):
-        """Clean up test environment"""
-        # Remove temporary directory
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def _copy_downloader(self, downloader_template):
+        """Give each test its own cheap copy of the template downloader"""
+        # The tests only patch attributes on the copy and mock yt-dlp, so the
+        # copy can share the template's download directories. close() gives it
+        # its own YoutubeDL cache so mocks don't leak between tests
+        self.downloader = copy.copy(downloader_template)
+        self.downloader.close()
+        self.downloader._playlist_info_cache = {}
     
-    def test_init(self):
+    def test_init(self, tmp_path):
         """Test downloader initialization"""
+        test_dir = str(tmp_path / "nested" / "Downloads")
+        downloader = YouTubeDownloader(download_path=test_dir)
+        
         # Check that directories are created
-        self.assertTrue(Path(self.test_dir).exists())
-        self.assertTrue(self.downloader.single_videos_path.exists())
-        self.assertTrue(self.downloader.playlists_path.exists())
+        assert Path(test_dir).exists()
+        assert downloader.single_videos_path.exists()
+        assert downloader.playlists_path.exists()
         
         # Check paths are set correctly
-        self.assertEqual(str(self.downloader.download_path), self.test_dir)
-    
-    def test_is_playlist_url(self):
-        """Test playlist URL detection"""
-        # Test playlist URLs
-        playlist_urls = [
-            "https://www.youtube.com/playlist?list=PLrAXtmRdnEQy6nuLvzey9DAEdGjNMi56M",
-            "https://youtube.com/playlist?list=PLrAXtmRdnEQy6nuLvzey9DAEdGjNMi56M",
-            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PLrAXtmRdnEQy6nuLvzey9DAEdGjNMi56M",
-        ]
-        
-        for url in playlist_urls:
-            with self.subTest(url=url):
-                self.assertTrue(self.downloader.is_playlist_url(url))
-        
-        # Test single video URLs
-        video_urls = [
-            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-            "https://youtu.be/dQw4w9WgXcQ",
-            "https://youtube.com/watch?v=dQw4w9WgXcQ",
-        ]
-        
-        for url in video_urls:
-            with self.subTest(url=url):
-                self.assertFalse(self.downloader.is_playlist_url(url))
-    
-    def test_sanitize_filename(self):
-        """Test filename sanitization"""
-        test_cases = [
-            ("Normal Title", "Normal Title"),
-            ("Title/with\\illegal:chars", "Title_with_illegal_chars"),
-            ("Title<with>more|illegal?chars*", "Title_with_more_illegal_chars_"),
-            ("   Title with spaces   ", "Title with spaces"),
-            ("Title" + "a" * 200, "Title" + "a" * 195),  # Test length limit
-        ]
+        assert str(downloader.download_path) == test_dir
+    
+    def test_aria2c_is_opt_in(self, tmp_path):
+        """Test that aria2c is only used when asked for, even if it is installed"""
+        with patch('youtube_downloader.shutil.which', return_value='/usr/bin/aria2c'):
+            default = YouTubeDownloader(download_path=str(tmp_path))
+            opted_in = YouTubeDownloader(download_path=str(tmp_path), use_aria2c=True)
         
-        for input_title, expected in test_cases:
-            with self.subTest(input_title=input_title):
-                result = self.downloader.sanitize_filename(input_title)
-                self.assertEqual(result, expected)
-                # Ensure no illegal characters remain
-                illegal_chars = r'<>:"/\|?*'
-                self.assertFalse(any(char in result for char in illegal_chars))
+        assert 'external_downloader' not in default.single_video_opts
+        assert 'external_downloader' not in default.playlist_opts
+        assert opted_in.single_video_opts['external_downloader'] == {'default': 'aria2c'}
+        assert opted_in.playlist_opts['external_downloader'] == {'default': 'aria2c'}
     
-    @patch('youtube_downloader.yt_dlp.YoutubeDL')
-    def test_get_playlist_info(self, mock_ytdl):
+    def test_get_playlist_info(self, fake_info):
         """Test playlist info extraction"""
         # Mock successful playlist info extraction
-        mock_info = {
-            'title': 'Test Playlist',
-            'entries': [{'title': 'Video 1'}, {'title': 'Video 2'}]
-        }
+        mock_ytdl, mock_ytdl_instance = _make_ytdl_mock(info=fake_info)
         
-        mock_ytdl_instance = Mock()
-        mock_ytdl_instance.extract_info.return_value = mock_info
-        mock_ytdl.return_value.__enter__.return_value = mock_ytdl_instance
+        with patch('youtube_downloader.yt_dlp.YoutubeDL', mock_ytdl):
+            result = self.downloader.get_playlist_info("https://www.youtube.com/playlist?list=TEST")
         
-        result = self.downloader.get_playlist_info("https://www.youtube.com/playlist?list=TEST")
+        assert result == fake_info
+        mock_ytdl_instance.extract_info.assert_called_once()
+    
+    def test_get_playlist_info_metadata_cache(self, fake_info, tmp_path):
+        """Test that playlist info stored by one run is reused by the next"""
+        url = "https://www.youtube.com/playlist?list=TEST"
+        mock_ytdl, mock_ytdl_instance = _make_ytdl_mock(info=fake_info)
+        
+        with patch('youtube_downloader.yt_dlp.YoutubeDL', mock_ytdl):
+            self.downloader.metadata_cache = MetadataCache(tmp_path / "meta.db")
+            assert self.downloader.get_playlist_info(url) == fake_info
+            
+            # A fresh downloader has an empty in-memory cache
+            rerun = copy.copy(self.downloader)
+            rerun._playlist_info_cache = {}
+            assert rerun.get_playlist_info(url) == fake_info
         
-        self.assertEqual(result, mock_info)
         mock_ytdl_instance.extract_info.assert_called_once()
+        
+        # Stale and cleared entries are fetched again
+        assert MetadataCache(tmp_path / "meta.db", ttl=0).get(url) is None
+        self.downloader.metadata_cache.clear()
+        assert self.downloader.metadata_cache.get(url) is None
+    
+    def test_metadata_cache_unavailable(self):
+        """Test that an unusable cache location means no cache rather than a crash"""
+        with patch('youtube_downloader.MetadataCache', side_effect=PermissionError("read-only")), \
+             patch('builtins.print'):
+            assert open_metadata_cache() is None
+        with patch('youtube_downloader.MetadataCache.__init__',
+                   side_effect=sqlite3.OperationalError("unable to open database file")), \
+             patch('builtins.print'):
+            assert open_metadata_cache(refresh=True) is None
     
-    @patch('youtube_downloader.yt_dlp.YoutubeDL')
-    def test_download_single_video_success(self, mock_ytdl):
+    def test_ytdl_instances_are_reused(self, fake_info):
+        """Test that YoutubeDL is built once per options and closed by close()"""
+        mock_ytdl, mock_ytdl_instance = _make_ytdl_mock(info=fake_info)
+        
+        with patch('youtube_downloader.yt_dlp.YoutubeDL', mock_ytdl):
+            self.downloader.get_info("https://www.youtube.com/watch?v=TEST1")
+            self.downloader.get_info("https://www.youtube.com/watch?v=TEST2")
+            # Repeated playlist lookups are answered from the cache
+            self.downloader.get_playlist_info("https://www.youtube.com/playlist?list=TEST")
+            self.downloader.get_playlist_info("https://www.youtube.com/playlist?list=TEST")
+            self.downloader.close()
+        
+        assert mock_ytdl.call_count == 1
+        assert mock_ytdl_instance.extract_info.call_count == 3
+        mock_ytdl_instance.close.assert_called_once()
+    
+    def test_download_single_video_success(self, fake_info):
         """Test successful single video download"""
-        # Mock successful download
-        mock_info = {'title': 'Test Video'}
+        # Mock successful download of the playlist's first video
+        mock_ytdl, mock_ytdl_instance = _make_ytdl_mock()
+        video_info = fake_info['entries'][0]
         
-        mock_ytdl_instance = Mock()
-        mock_ytdl_instance.extract_info.return_value = mock_info
-        mock_ytdl_instance.download.return_value = None
-        mock_ytdl.return_value.__enter__.return_value = mock_ytdl_instance
+        def extract_info(url, download=True):
+            for hook in mock_ytdl.call_args.args[0]['progress_hooks']:
+                for _ in range(2):
+                    hook({'status': 'downloading', 'info_dict': video_info})
+            return {**video_info, 'requested_downloads': [{'filepath': 'Video 1.mp4'}]}
+        mock_ytdl_instance.extract_info.side_effect = extract_info
         
-        result = self.downloader.download_single_video("https://www.youtube.com/watch?v=TEST")
+        with patch('youtube_downloader.yt_dlp.YoutubeDL', mock_ytdl), \
+             patch('builtins.print') as mock_print:
+            result = self.downloader.download_single_video("https://www.youtube.com/watch?v=TEST")
         
-        self.assertTrue(result)
-        mock_ytdl_instance.extract_info.assert_called()
-        mock_ytdl_instance.download.assert_called_once()
+        assert result
+        # One request for the video; the title comes from the progress hook, once
+        mock_ytdl_instance.extract_info.assert_called_once()
+        mock_ytdl_instance.download.assert_not_called()
+        printed = [str(call.args[0]) for call in mock_print.call_args_list if call.args]
+        assert sum("Title: Video 1" in line for line in printed) == 1
     
-    @patch('youtube_downloader.yt_dlp.YoutubeDL')
-    def test_download_single_video_failure(self, mock_ytdl):
+    @pytest.mark.parametrize("info", [
+        None,  # extraction failed
+        {'id': 'TEST', 'requested_downloads': [{'format_id': '18'}]},  # download failed
+    ])
+    def test_download_single_video_failure(self, info):
         """Test failed single video download"""
-        # Mock download failure
-        mock_ytdl_instance = Mock()
-        mock_ytdl_instance.extract_info.side_effect = Exception("Download failed")
-        mock_ytdl.return_value.__enter__.return_value = mock_ytdl_instance
+        # With ignoreerrors yt-dlp reports the error instead of raising it
+        mock_ytdl, mock_ytdl_instance = _make_ytdl_mock(info=info)
+        
+        with patch('youtube_downloader.yt_dlp.YoutubeDL', mock_ytdl), \
+             patch('builtins.print'):
+            result = self.downloader.download_single_video("https://www.youtube.com/watch?v=TEST")
+        
+        assert not result
+    
+    def test_download_playlist_entries(self):
+        """Test that playlist entries are downloaded one by one and counted"""
+        playlist_info = {
+            'title': 'Test: 100% Playlist',
+            'entries': [{'id': 'VIDEO1'}, {'url': 'https://www.youtube.com/watch?v=VIDEO2'}, None]
+        }
+        
+        instances = []
+        
+        def fake_ytdl(opts):
+            # VIDEO1 is already on disk from an earlier run, so yt-dlp fires no
+            # progress hooks but still reports its filepath; VIDEO2 fails
+            def extract_info(url, download=True, extra_info=None):
+                if url.endswith('VIDEO1'):
+                    requested = [{'filepath': '01 - Video 1.mp4'}]
+                else:
+                    requested = [{'format_id': '18'}]
+                return {'requested_downloads': requested, **extra_info}
+            
+            mock_ytdl_instance = MagicMock()
+            mock_ytdl_instance.extract_info.side_effect = extract_info
+            instances.append(mock_ytdl_instance)
+            return mock_ytdl_instance
+        
+        mock_ytdl = Mock(side_effect=fake_ytdl)
+        with patch.object(self.downloader, 'get_playlist_info', return_value=playlist_info), \
+             patch('youtube_downloader.yt_dlp.YoutubeDL', mock_ytdl), \
+             patch('builtins.print') as mock_print:
+            result = self.downloader.download_playlist("https://www.youtube.com/playlist?list=TEST")
+        
+        assert result
+        printed = [str(call.args[0]) for call in mock_print.call_args_list if call.args]
+        assert any("Downloaded 1/3 videos" in line for line in printed)
+        # Every entry shares one output template; files are put in the
+        # playlist's sanitize_filename folder and numbered by their position
+        folder = str(self.downloader.playlists_path / 'Test_ 100%% Playlist')
+        assert {call.args[0]['outtmpl'] for call in mock_ytdl.call_args_list} == {
+            os.path.join(folder, '%(playlist_index)02d - %(title)s.%(ext)s')}
+        extra_infos = sorted(
+            (call.kwargs['extra_info'] for instance in instances
+             for call in instance.extract_info.call_args_list),
+            key=lambda info: info['playlist_index'])
+        assert extra_infos == [
+            {'playlist': 'Test_ 100% Playlist', 'playlist_index': 1},
+            {'playlist': 'Test_ 100% Playlist', 'playlist_index': 2},
+        ]
+    
+    def test_concurrent_downloads_share_one_bound(self):
+        """Test that playlists downloaded side by side stay within max_concurrent_downloads"""
+        playlist_info = {'title': 'Test Playlist', 'entries': [{'id': f'VIDEO{i}'} for i in range(6)]}
+        active = []
+        peak = []
+        lock = threading.Lock()
+        
+        def extract_info(url, download=True, extra_info=None):
+            with lock:
+                active.append(url)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(url)
+            return {'requested_downloads': [{'filepath': url}]}
         
-        result = self.downloader.download_single_video("https://www.youtube.com/watch?v=TEST")
+        mock_ytdl, mock_ytdl_instance = _make_ytdl_mock()
+        mock_ytdl_instance.extract_info.side_effect = extract_info
+        urls = [f"https://www.youtube.com/playlist?list=PL{i}" for i in range(3)]
+        with patch.object(self.downloader, 'get_playlist_info', return_value=playlist_info), \
+             patch('youtube_downloader.yt_dlp.YoutubeDL', mock_ytdl), \
+             patch('builtins.print'):
+            results = self.downloader.download_multiple_urls(urls)
         
-        self.assertFalse(result)
+        assert all(results.values())
+        assert mock_ytdl_instance.extract_info.call_count == 18
+        assert max(peak) <= self.downloader.max_concurrent_downloads
+        # Side-by-side downloads don't draw console progress bars over each other
+        assert mock_ytdl.call_args.args[0]['noprogress']
     
     def test_download_url_routing(self):
         """Test that download_url correctly routes to playlist or single video methods"""
@@ -137,7 +290,7 @@ class TestYouTubeDownloader(unittest.TestCase):
             
             result = self.downloader.download_url("https://www.youtube.com/playlist?list=TEST")
             
-            self.assertTrue(result)
+            assert result
             mock_download_playlist.assert_called_once()
             mock_download_single.assert_not_called()
             
@@ -151,7 +304,7 @@ class TestYouTubeDownloader(unittest.TestCase):
             
             result = self.downloader.download_url("https://www.youtube.com/watch?v=TEST")
             
-            self.assertTrue(result)
+            assert result
             mock_download_single.assert_called_once()
             mock_download_playlist.assert_not_called()
     
@@ -168,57 +321,97 @@ class TestYouTubeDownloader(unittest.TestCase):
             results = self.downloader.download_multiple_urls(urls)
             
             # Check that all URLs were processed
-            self.assertEqual(len(results), 2)
-            self.assertEqual(mock_download.call_count, 2)
+            assert len(results) == 2
+            assert mock_download.call_count == 2
             
             # Check that all downloads were successful
             for url, success in results.items():
-                self.assertTrue(success)
+                assert success
+
+
+@pytest.mark.parametrize("url, is_playlist", [
+    # Playlist URLs
+    ("https://www.youtube.com/playlist?list=PLrAXtmRdnEQy6nuLvzey9DAEdGjNMi56M", True),
+    ("https://youtube.com/playlist?list=PLrAXtmRdnEQy6nuLvzey9DAEdGjNMi56M", True),
+    ("https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PLrAXtmRdnEQy6nuLvzey9DAEdGjNMi56M", True),
+    ("https://youtu.be/dQw4w9WgXcQ?list=RDdQw4w9WgXcQ", True),
+    # Single video URLs
+    ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", False),
+    ("https://youtu.be/dQw4w9WgXcQ", False),
+    ("https://youtube.com/watch?v=dQw4w9WgXcQ", False),
+    # A list parameter that is not a playlist ID
+    ("https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=WL", False),
+])
+def test_is_playlist_url(url, is_playlist):
+    """Test playlist URL detection"""
+    # is_playlist_url is a staticmethod, so no downloader (or its directories) is needed
+    assert YouTubeDownloader.is_playlist_url(url) is is_playlist
+
 
+@pytest.mark.parametrize("input_title, expected", SANITIZE_CASES)
+def test_sanitize_filename(downloader_template, input_title, expected):
+    """Test filename sanitization"""
+    result = downloader_template.sanitize_filename(input_title)
+    assert result == expected
+    # Ensure no illegal characters remain
+    assert _ILLEGAL_RE.search(result) is None
 
-class TestURLValidation(unittest.TestCase):
+
+class TestURLValidation:
     """Test URL validation and parsing"""
     
-    def setUp(self):
-        self.downloader = YouTubeDownloader()
-    
-    def test_valid_youtube_urls(self):
+    @pytest.mark.parametrize("url", [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ",
+        "https://www.youtube.com/playlist?list=PLrAXtmRdnEQy6nuLvzey9DAEdGjNMi56M",
+        "https://youtube.com/playlist?list=PLrAXtmRdnEQy6nuLvzey9DAEdGjNMi56M",
+    ])
+    def test_valid_youtube_urls(self, url):
         """Test various valid YouTube URL formats"""
-        valid_urls = [
-            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-            "https://youtube.com/watch?v=dQw4w9WgXcQ",
-            "https://youtu.be/dQw4w9WgXcQ",
-            "https://www.youtube.com/playlist?list=PLrAXtmRdnEQy6nuLvzey9DAEdGjNMi56M",
-            "https://youtube.com/playlist?list=PLrAXtmRdnEQy6nuLvzey9DAEdGjNMi56M",
-        ]
-        
-        for url in valid_urls:
-            with self.subTest(url=url):
-                # These should not raise exceptions when parsed
-                result = self.downloader.is_playlist_url(url)
-                self.assertIsInstance(result, bool)
+        # These should not raise exceptions when parsed
+        result = YouTubeDownloader.is_playlist_url(url)
+        assert isinstance(result, bool)
     
-    def test_invalid_urls(self):
+    @pytest.mark.parametrize("url", [
+        "not_a_url",
+        "https://www.notyoutube.com/watch?v=test",
+        "https://vimeo.com/123456",
+        "",
+        None,
+    ])
+    def test_invalid_urls(self, url):
         """Test handling of invalid URLs"""
-        invalid_urls = [
-            "not_a_url",
-            "https://www.notyoutube.com/watch?v=test",
-            "https://vimeo.com/123456",
-            "",
-            None,
-        ]
+        try:
+            result = YouTubeDownloader.is_playlist_url(url)
+        except Exception:
+            # Raising an exception is also acceptable
+            return
+        # Should return False for invalid URLs, not crash
+        assert not result
+    
+    def test_batch_file(self, tmp_path, monkeypatch):
+        """Test that a batch file is validated in one pass and downloaded without prompting"""
+        batch_file = tmp_path / "urls.txt"
+        batch_file.write_text(
+            "# comment\n"
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ\n"
+            "\n"
+            "https://vimeo.com/123456\n"
+            "  https://youtu.be/dQw4w9WgXcQ  \n"
+        )
+        monkeypatch.chdir(tmp_path)
         
-        for url in invalid_urls:
-            with self.subTest(url=url):
-                try:
-                    result = self.downloader.is_playlist_url(url)
-                    # Should return False for invalid URLs, not crash
-                    self.assertFalse(result)
-                except Exception:
-                    # Or it might raise an exception, which is also acceptable
-                    pass
+        with patch.object(YouTubeDownloader, 'download_multiple_urls') as mock_download, \
+             patch('builtins.input', side_effect=AssertionError("batch mode must not prompt")):
+            batch_main(str(batch_file))
+        
+        mock_download.assert_called_once_with([
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ",
+        ])
 
 
 if __name__ == '__main__':
-    # Run tests with verbose output
-    unittest.main(verbosity=2)
+    # Run tests with verbose output (the fixtures above need pytest)
+    sys.exit(pytest.main([__file__, "-v"]))
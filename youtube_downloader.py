@@ -1,22 +1,163 @@
 import os
 import re
+import argparse
 import sys
 import json
 import time
+import shutil
+import hashlib
+import sqlite3
+import threading
+import importlib.util
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
-from urllib.parse import urlparse, parse_qs
+
+class _NoColor:
+    """Stand-in for colorama's Fore and Style that yields no escape codes."""
+    
+    def __getattr__(self, name):
+        return ''
+
 
 try:
-    import yt_dlp
-    from colorama import init, Fore, Style
-    init(autoreset=True)
+    # yt-dlp takes a few hundred milliseconds to import (it registers every
+    # extractor), so only check that it is installed; see _yt_dlp()
+    if importlib.util.find_spec('yt_dlp') is None:
+        raise ImportError("No module named 'yt_dlp'")
+    
+    if sys.stdout is not None and sys.stdout.isatty():
+        from colorama import init, Fore, Style
+        init(autoreset=True)
+    else:
+        # Piped or redirected output: colorama would only strip the codes
+        # again, scanning every write through its stream wrapper, so emit none
+        Fore = Style = _NoColor()
 except ImportError as e:
     print(f"Missing required dependency: {e}")
     print("Please install dependencies with: pip install -r requirements.txt")
     sys.exit(1)
 
 
+def _yt_dlp():
+    """Return the yt_dlp module, importing it on first use."""
+    global yt_dlp
+    try:
+        return yt_dlp
+    except NameError:
+        import yt_dlp
+        return yt_dlp
+
+
+def __getattr__(name):
+    # Keep youtube_downloader.yt_dlp working for callers and mock.patch
+    if name == 'yt_dlp':
+        return _yt_dlp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Either "playlist" in the URL path, or the value of the list= query parameter;
+# one search replaces urlparse + parse_qs
+_PLAYLIST_RE = re.compile(r"""
+    ^(?:[A-Za-z][A-Za-z0-9+.-]*://[^/?#]*(?![^/?#])   # scheme and the whole host, if present
+       |(?![A-Za-z][A-Za-z0-9+.-]*://))
+    [^?#]*(?i:playlist)                                # "playlist" in the path
+    |[?&]list=([^&#]+)                                 # or the list= query parameter
+""", re.VERBOSE)
+
+# Basic check that a URL points at YouTube
+_YT_HOST_RE = re.compile(r'(?:youtube\.com|youtu\.be)/')
+
+# Prefixes of list IDs that are real playlists (uploads, favorites, mixes, likes)
+_PL_PREFIXES = frozenset({'PL', 'UU', 'FL', 'RD', 'LL'})
+
+# Characters that are not allowed in file names
+_ILLEGAL_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Per-thread download state for the progress hooks: whether the title of the
+# video being downloaded is still to be shown (see _show_title)
+_progress_state = threading.local()
+
+# Options for metadata lookups; for playlists, just get basic info about the
+# entries - each entry is extracted in full only when it is downloaded
+INFO_OPTS = {
+    'quiet': True,
+    'extract_flat': 'in_playlist',
+    'force_json': True
+}
+
+# Where the command-line interface keeps playlist metadata between runs, and
+# how long (in seconds) an entry stays fresh
+METADATA_CACHE_PATH = Path.home() / '.cache' / 'youtube-downloader' / 'meta.db'
+METADATA_CACHE_TTL = 24 * 60 * 60
+
+
+class MetadataCache:
+    """
+    SQLite-backed cache of playlist information, so running the tool again on
+    the same playlists doesn't repeat the metadata extraction.
+    """
+    
+    def __init__(self, path=METADATA_CACHE_PATH, ttl: float = METADATA_CACHE_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, ts REAL, info TEXT)')
+    
+    def _execute(self, sql: str, params: Tuple = ()):
+        """Run one statement and return its first row."""
+        # Lookups come from several download threads, so use a short-lived
+        # connection per statement rather than sharing one
+        with closing(sqlite3.connect(self.path, timeout=10)) as conn:
+            with conn:
+                return conn.execute(sql, params).fetchone()
+    
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the cached information for url, or None if missing or stale."""
+        try:
+            row = self._execute('SELECT ts, info FROM meta WHERE key = ?', (self._key(url),))
+        except sqlite3.Error:
+            return None
+        if row is None or time.time() - row[0] >= self.ttl:
+            return None
+        return json.loads(row[1])
+    
+    def set(self, url: str, info: Dict):
+        """Store the information for url."""
+        try:
+            self._execute('INSERT OR REPLACE INTO meta (key, ts, info) VALUES (?, ?, ?)',
+                          (self._key(url), time.time(), json.dumps(info, default=str)))
+        except sqlite3.Error:
+            pass  # The cache is only an optimization
+    
+    def clear(self):
+        """Forget all cached information."""
+        self._execute('DELETE FROM meta')
+
+
+def open_metadata_cache(refresh: bool = False) -> Optional[MetadataCache]:
+    """
+    Open the command-line metadata cache, optionally clearing it first.
+    
+    Returns:
+        Optional[MetadataCache]: The cache, or None when it can't be created
+        (e.g. a read-only home directory) - downloads then run without it
+    """
+    try:
+        cache = MetadataCache()
+        if refresh:
+            cache.clear()
+        return cache
+    except (OSError, sqlite3.Error) as e:
+        print(f"{Fore.YELLOW}Metadata cache unavailable, continuing without it: {e}")
+        return None
+
+
 class YouTubeDownloader:
     """
     A comprehensive YouTube downloader that handles both single videos and playlists.
@@ -24,7 +165,9 @@ class YouTubeDownloader:
     """
     
     def __init__(self, download_path: str = "Downloads", download_subtitles: bool = True, 
-                 embed_subtitles: bool = False, subtitle_languages: List[str] = None):
+                 embed_subtitles: bool = False, subtitle_languages: List[str] = None,
+                 metadata_cache: Optional[MetadataCache] = None, max_concurrent_downloads: int = 4,
+                 use_aria2c: bool = False):
         self.download_path = Path(download_path)
         self.single_videos_path = self.download_path / "Single Videos"
         self.playlists_path = self.download_path / "Playlists"
@@ -34,10 +177,22 @@ class YouTubeDownloader:
         self.embed_subtitles = embed_subtitles
         self.subtitle_languages = subtitle_languages or ['en', 'en-US', 'en-GB', 'en.*']
         
-        # Create download directories
-        self.download_path.mkdir(exist_ok=True)
-        self.single_videos_path.mkdir(exist_ok=True)
-        self.playlists_path.mkdir(exist_ok=True)
+        # Per-thread YoutubeDL instances (see _get_ydl) and looked-up playlists
+        self._ydl_local = threading.local()
+        self._ydl_lock = threading.Lock()
+        self._open_ydls = []
+        self._playlist_info_cache = {}
+        self.metadata_cache = metadata_cache
+        
+        # URLs and playlist entries are downloaded on thread pools, and a
+        # playlist's pool runs inside the URL pool. Each video download takes a
+        # slot, so however the two nest, at most this many run at once
+        self.max_concurrent_downloads = max(1, max_concurrent_downloads)
+        self._download_slots = threading.BoundedSemaphore(self.max_concurrent_downloads)
+        
+        # Create download directories (parents=True creates download_path too)
+        self.single_videos_path.mkdir(parents=True, exist_ok=True)
+        self.playlists_path.mkdir(parents=True, exist_ok=True)
         
         # Configure yt-dlp options for single videos - Updated for proper audio+video merging
         self.single_video_opts = {
@@ -62,11 +217,16 @@ class YouTubeDownloader:
             'merge_output_format': 'mp4',
             'prefer_ffmpeg': True,
             'keepvideo': False,
+            'progress_hooks': [self._show_title],
         }
         
         # Configure yt-dlp options for playlists - Updated for proper audio+video merging
         self.playlist_opts = {
             'format': 'bv*[height<=1080]+ba/b[height<=1080]/b',  # Best video+audio up to 1080p with fallback
+            # One folder per playlist, files numbered by position; yt-dlp fills
+            # these in itself. download_playlist names the folder instead (see there)
+            'outtmpl': str(self.playlists_path / '%(playlist|Unknown Playlist)s'
+                           / '%(playlist_index)02d - %(title)s.%(ext)s'),
             'restrictfilenames': True,
             'writesubtitles': self.download_subtitles,
             'writeautomaticsub': self.download_subtitles,
@@ -86,7 +246,26 @@ class YouTubeDownloader:
             'merge_output_format': 'mp4',
             'prefer_ffmpeg': True,
             'keepvideo': False,
+            # Fetch the fragments of HLS/DASH streams in parallel too
+            'concurrent_fragment_downloads': 4,
         }
+        
+        # Progress bars of downloads running side by side overwrite each other
+        # on the console, so leave progress to the summary lines
+        if self.max_concurrent_downloads > 1:
+            for opts in (self.single_video_opts, self.playlist_opts):
+                opts['noprogress'] = True
+        
+        # Optionally let aria2c fetch each file over several connections instead
+        # of yt-dlp's single-connection downloader. Off by default: yt-dlp gets
+        # no progress updates from external downloaders, so progress hooks
+        # (and the GUI's progress rows) would stall
+        if use_aria2c and not shutil.which('aria2c'):
+            print(f"{Fore.YELLOW}aria2c not found on PATH, using the built-in downloader")
+        elif use_aria2c:
+            for opts in (self.single_video_opts, self.playlist_opts):
+                opts['external_downloader'] = {'default': 'aria2c'}
+                opts['external_downloader_args'] = {'aria2c': ['-x', '4', '-s', '4', '-k', '1M']}
     
     def configure_subtitles(self, download_subtitles: bool = True, embed_subtitles: bool = False, 
                            subtitle_languages: List[str] = None):
@@ -133,7 +312,44 @@ class YouTubeDownloader:
         self.single_video_opts.update(subtitle_opts)
         self.playlist_opts.update(subtitle_opts)
     
-    def is_playlist_url(self, url: str) -> bool:
+    def _get_ydl(self, opts: Dict) -> "yt_dlp.YoutubeDL":
+        """
+        Return this thread's YoutubeDL for the given options, creating it on first use.
+        
+        Building a YoutubeDL sets up the extractors and the HTTP handlers, so
+        instances are kept and reused. YoutubeDL is not thread-safe, so each
+        thread has its own; call close() to release them.
+        
+        Args:
+            opts (Dict): yt-dlp options
+            
+        Returns:
+            yt_dlp.YoutubeDL: Cached instance for these options
+        """
+        cache = getattr(self._ydl_local, 'cache', None)
+        if cache is None:
+            cache = self._ydl_local.cache = {}
+        
+        # Option values include lists, so key on their repr instead of hashing
+        key = repr(sorted(opts.items()))
+        ydl = cache.get(key)
+        if ydl is None:
+            # yt-dlp rewrites its options in place, so give it a copy
+            ydl = cache[key] = _yt_dlp().YoutubeDL(opts.copy())
+            with self._ydl_lock:
+                self._open_ydls.append(ydl)
+        return ydl
+    
+    def close(self):
+        """Close the cached YoutubeDL instances of every thread."""
+        with self._ydl_lock:
+            ydls, self._open_ydls = self._open_ydls, []
+        self._ydl_local = threading.local()
+        for ydl in ydls:
+            ydl.close()
+    
+    @staticmethod
+    def is_playlist_url(url: str) -> bool:
         """
         Determine if a URL is a playlist or single video.
         
@@ -144,25 +360,19 @@ class YouTubeDownloader:
             bool: True if URL is a playlist, False otherwise
         """
         try:
-            # Parse the URL
-            parsed_url = urlparse(url)
-            
-            # Check for playlist indicators
-            if 'playlist' in parsed_url.path.lower():
-                return True
-            
-            # Check query parameters for playlist list
-            query_params = parse_qs(parsed_url.query)
-            if 'list' in query_params:
-                # Some single videos can have list parameter, so we need to check further
-                list_id = query_params['list'][0]
-                # Playlist IDs typically start with 'PL', 'UU', 'FL', etc.
-                if list_id.startswith(('PL', 'UU', 'FL', 'RD', 'LL')):
-                    return True
-            
+            match = _PLAYLIST_RE.search(url)
+        except TypeError:
             return False
-        except Exception:
+        if not match:
             return False
+        
+        # A playlist path matches without a list ID
+        list_id = match.group(1)
+        if list_id is None:
+            return True
+        # Some single videos can have list parameter, so we need to check further.
+        # Playlist IDs typically start with 'PL', 'UU', 'FL', etc.
+        return list_id[:2] in _PL_PREFIXES
     
     def get_info(self, url: str) -> Optional[Dict]:
         """
@@ -175,15 +385,7 @@ class YouTubeDownloader:
             Optional[Dict]: Video/playlist information or None if failed
         """
         try:
-            opts = {
-                'quiet': True,
-                'extract_flat': True,  # For playlists, just get basic info
-                'force_json': True
-            }
-            
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return info
+            return self._get_ydl(INFO_OPTS).extract_info(url, download=False)
         except Exception as e:
             print(f"{Fore.RED}Error extracting info: {e}")
             return None
@@ -198,19 +400,30 @@ class YouTubeDownloader:
         Returns:
             Optional[Dict]: Playlist information or None if failed
         """
-        try:
-            opts = {
-                'quiet': True,
-                'extract_flat': True,
-                'force_json': True
-            }
-            
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+        # download_playlist asks again for a playlist already looked up
+        # (e.g. by a caller checking it first), so reuse the earlier result
+        info = self._playlist_info_cache.get(url)
+        if info is not None:
+            return info
+        
+        # Then what an earlier run stored on disk
+        if self.metadata_cache is not None:
+            info = self.metadata_cache.get(url)
+            if info is not None:
+                self._playlist_info_cache[url] = info
                 return info
+        
+        try:
+            info = self._get_ydl(INFO_OPTS).extract_info(url, download=False)
         except Exception as e:
             print(f"{Fore.RED}Error extracting playlist info: {e}")
             return None
+        
+        if info is not None:
+            self._playlist_info_cache[url] = info
+            if self.metadata_cache is not None:
+                self.metadata_cache.set(url, info)
+        return info
     
     def sanitize_filename(self, filename: str) -> str:
         """
@@ -223,15 +436,16 @@ class YouTubeDownloader:
             str: Sanitized filename
         """
         # Remove or replace illegal characters
-        illegal_chars = r'[<>:"/\\|?*]'
-        filename = re.sub(illegal_chars, '_', filename)
+        filename = _ILLEGAL_FILENAME_RE.sub('_', filename)
         
         # Remove leading/trailing whitespace and dots
         filename = filename.strip(' .')
         
-        # Limit length
-        if len(filename) > 200:
-            filename = filename[:200]
+        # Limit length - filesystems count bytes, not characters, so cut the
+        # UTF-8 encoding and drop any character split at the end
+        encoded = filename.encode('utf-8')
+        if len(encoded) > 200:
+            filename = encoded[:200].decode('utf-8', 'ignore')
         
         return filename
     
@@ -248,31 +462,24 @@ class YouTubeDownloader:
         try:
             print(f"{Fore.BLUE}Downloading single video...")
             
-            with yt_dlp.YoutubeDL(self.single_video_opts) as ydl:
-                # Extract video info first
-                try:
-                    info = ydl.extract_info(url, download=False)
-                    title = info.get('title', 'Unknown Title')
-                    print(f"{Fore.GREEN}Title: {title}")
-                    
-                    # Check if video is available
-                    if info.get('availability') == 'private':
-                        print(f"{Fore.RED}Video is private and cannot be downloaded")
-                        return False
-                    elif info.get('availability') == 'premium_only':
-                        print(f"{Fore.RED}Video requires premium membership")
-                        return False
-                    
-                except Exception as e:
-                    print(f"{Fore.RED}Error getting video info: {e}")
-                    print(f"{Fore.YELLOW}Attempting direct download...")
-                
-                # Download the video
-                ydl.download([url])
-                print(f"{Fore.GREEN}✓ Successfully downloaded single video")
-                return True
-                
-        except yt_dlp.utils.DownloadError as e:
+            # Extract and download in one call - a separate info request first
+            # would fetch the watch page twice. _show_title prints the title
+            # once the download starts
+            _progress_state.title_pending = True
+            with self._download_slots:
+                info = self._get_ydl(self.single_video_opts).extract_info(url, download=True)
+            
+            # ignoreerrors makes yt-dlp report failures instead of raising:
+            # extraction errors return None and failed downloads leave
+            # filepath unset, so only a file in place counts as success
+            downloads = (info or {}).get('requested_downloads') or []
+            if not any(download.get('filepath') for download in downloads):
+                print(f"{Fore.RED}✗ Failed to download single video")
+                return False
+            print(f"{Fore.GREEN}✓ Successfully downloaded single video")
+            return True
+            
+        except _yt_dlp().utils.DownloadError as e:
             if "403" in str(e) or "Forbidden" in str(e):
                 print(f"{Fore.RED}Access denied (403 Forbidden). This video may be:")
                 print(f"{Fore.RED}  - Age restricted")
@@ -318,42 +525,35 @@ class YouTubeDownloader:
             print(f"{Fore.GREEN}Playlist: {playlist_title}")
             print(f"{Fore.GREEN}Videos found: {len(entries)}")
             
-            # Create playlist folder
-            playlist_folder = self.playlists_path / playlist_title
-            playlist_folder.mkdir(exist_ok=True)
-            
-            # Configure output template for numbered files
-            playlist_opts = self.playlist_opts.copy()
-            playlist_opts['outtmpl'] = str(playlist_folder / '%(playlist_index)02d - %(title)s.%(ext)s')
+            # The folder keeps its sanitize_filename name, so playlists downloaded
+            # before are found again rather than fetched into a new folder under
+            # yt-dlp's own naming. One template per playlist (not per entry) lets
+            # each worker reuse its YoutubeDL for all the entries it downloads
+            folder = str(self.playlists_path / playlist_title).replace('%', '%%')
+            playlist_opts = {**self.playlist_opts,
+                             'outtmpl': os.path.join(folder, '%(playlist_index)02d - %(title)s.%(ext)s')}
             
-            # Download the playlist with better error handling
+            # Download the entries side by side instead of handing yt-dlp the
+            # whole playlist, which would fetch one video after another
             successful_downloads = 0
             failed_downloads = 0
             
-            try:
-                with yt_dlp.YoutubeDL(playlist_opts) as ydl:
-                    ydl.download([url])
-                    
-                # Count successful downloads by checking the folder
-                downloaded_files = list(playlist_folder.glob('*.mp4')) + list(playlist_folder.glob('*.webm')) + list(playlist_folder.glob('*.mkv'))
-                successful_downloads = len(downloaded_files)
-                failed_downloads = len(entries) - successful_downloads
-                
-            except yt_dlp.utils.DownloadError as e:
-                if "403" in str(e) or "Forbidden" in str(e):
-                    print(f"{Fore.RED}Access denied for some videos. These may be:")
-                    print(f"{Fore.RED}  - Age restricted")
-                    print(f"{Fore.RED}  - Region blocked")
-                    print(f"{Fore.RED}  - Require login")
-                elif "404" in str(e):
-                    print(f"{Fore.RED}Some videos in the playlist were not found (deleted or private)")
-                else:
-                    print(f"{Fore.RED}Download error: {e}")
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrent_downloads, len(entries))) as executor:
+                futures = []
+                for index, entry in enumerate(entries, 1):
+                    entry_url = self._playlist_entry_url(entry)
+                    if not entry_url:
+                        # Deleted or private videos come back without a URL
+                        failed_downloads += 1
+                        continue
+                    futures.append(executor.submit(self._download_playlist_entry, entry_url,
+                                                   playlist_opts, playlist_title, index))
                 
-                # Still count what was downloaded
-                downloaded_files = list(playlist_folder.glob('*.mp4')) + list(playlist_folder.glob('*.webm')) + list(playlist_folder.glob('*.mkv'))
-                successful_downloads = len(downloaded_files)
-                failed_downloads = len(entries) - successful_downloads
+                for future in as_completed(futures):
+                    if future.result():
+                        successful_downloads += 1
+                    else:
+                        failed_downloads += 1
             
             # Report results
             if successful_downloads > 0:
@@ -369,6 +569,66 @@ class YouTubeDownloader:
             print(f"{Fore.RED}Error downloading playlist: {e}")
             return False
     
+    @staticmethod
+    def _playlist_entry_url(entry: Optional[Dict]) -> Optional[str]:
+        """Return the video URL of a flat playlist entry, or None if it has none"""
+        if not entry:
+            return None
+        if entry.get('url'):
+            return entry['url']
+        if entry.get('id'):
+            return f"https://www.youtube.com/watch?v={entry['id']}"
+        return None
+    
+    @staticmethod
+    def _show_title(d: Dict):
+        """yt-dlp progress hook: print the title when a single video starts downloading."""
+        if d.get('status') == 'downloading' and getattr(_progress_state, 'title_pending', False):
+            _progress_state.title_pending = False
+            title = (d.get('info_dict') or {}).get('title', 'Unknown Title')
+            print(f"{Fore.GREEN}Title: {title}")
+    
+    def _download_playlist_entry(self, entry_url: str, opts: Dict, playlist_title: str, index: int) -> bool:
+        """
+        Download a single playlist entry.
+        
+        Args:
+            entry_url (str): Video URL of the entry
+            opts (Dict): yt-dlp options for the playlist, with its output template
+            playlist_title (str): Title of the playlist
+            index (int): Position of the entry in the playlist, used to number the file
+            
+        Returns:
+            bool: True if the video file was downloaded or already exists, False otherwise
+        """
+        try:
+            # The entry is extracted on its own, so yt-dlp doesn't know which
+            # playlist it came from - pass that in for the output template
+            with self._download_slots:
+                info = self._get_ydl(opts).extract_info(
+                    entry_url, download=True,
+                    extra_info={'playlist': playlist_title, 'playlist_index': index})
+            
+            # yt-dlp only sets filepath once the file is in place - either
+            # downloaded now or found from an earlier run. ignoreerrors makes
+            # failed extractions return None and failed downloads leave it unset
+            downloads = (info or {}).get('requested_downloads') or []
+            return any(download.get('filepath') for download in downloads)
+        except _yt_dlp().utils.DownloadError as e:
+            if "403" in str(e) or "Forbidden" in str(e):
+                print(f"{Fore.RED}Access denied for {entry_url}. This video may be:")
+                print(f"{Fore.RED}  - Age restricted")
+                print(f"{Fore.RED}  - Region blocked")
+                print(f"{Fore.RED}  - Require login")
+            elif "404" in str(e):
+                print(f"{Fore.RED}Video not found (deleted or private): {entry_url}")
+            else:
+                print(f"{Fore.RED}Download error: {e}")
+            return False
+        except Exception as e:
+            print(f"{Fore.RED}Error downloading {entry_url}: {e}")
+            return False
+    
     def download_url(self, url: str) -> bool:
         """
         Download from a URL (automatically detects playlist vs single video).
@@ -390,7 +650,7 @@ class YouTubeDownloader:
     
     def download_multiple_urls(self, urls: List[str]) -> Dict[str, bool]:
         """
-        Download from multiple URLs.
+        Download from multiple URLs, several at a time (see max_concurrent_downloads).
         
         Args:
             urls (List[str]): List of YouTube URLs
@@ -398,55 +658,73 @@ class YouTubeDownloader:
         Returns:
             Dict[str, bool]: Results for each URL
         """
-        results = {}
+        # Pre-fill so the results keep the order the URLs were given in
+        results = {url: False for url in urls}
         total_urls = len(urls)
         
         print(f"{Fore.MAGENTA}Starting download of {total_urls} URL(s)...")
         print("=" * 60)
         
-        for i, url in enumerate(urls, 1):
-            print(f"\n{Fore.MAGENTA}[{i}/{total_urls}] Processing URL...")
+        # Downloads spend most of their time waiting on the network, so run a
+        # few side by side; yt-dlp's own sleep_interval keeps requests polite
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrent_downloads, total_urls))) as executor:
+            futures = {executor.submit(self.download_url, url.strip()): url for url in urls}
             
-            try:
-                success = self.download_url(url.strip())
-                results[url] = success
+            for i, future in enumerate(as_completed(futures), 1):
+                url = futures[future]
+                print(f"\n{Fore.MAGENTA}[{i}/{total_urls}] {url}")
                 
-                if success:
-                    print(f"{Fore.GREEN}✓ Completed successfully")
-                else:
-                    print(f"{Fore.RED}✗ Failed to download")
+                try:
+                    success = future.result()
+                    results[url] = success
                     
-            except Exception as e:
-                print(f"{Fore.RED}✗ Error: {e}")
-                results[url] = False
-            
-            # Add small delay between downloads
-            if i < total_urls:
-                time.sleep(1)
+                    if success:
+                        print(f"{Fore.GREEN}✓ Completed successfully")
+                    else:
+                        print(f"{Fore.RED}✗ Failed to download")
+                        
+                except Exception as e:
+                    print(f"{Fore.RED}✗ Error: {e}")
+                    results[url] = False
+        
+        # The worker threads are gone, so release their yt-dlp instances
+        self.close()
         
         # Print summary
         print("\n" + "=" * 60)
         print(f"{Fore.MAGENTA}Download Summary:")
-        successful = sum(1 for success in results.values() if success)
-        failed = total_urls - successful
+        failed_urls = [url for url, success in results.items() if not success]
+        successful = len(results) - len(failed_urls)
         
         print(f"{Fore.GREEN}Successful: {successful}")
-        print(f"{Fore.RED}Failed: {failed}")
+        print(f"{Fore.RED}Failed: {len(failed_urls)}")
         
-        if failed > 0:
-            print(f"\n{Fore.RED}Failed URLs:")
-            for url, success in results.items():
-                if not success:
-                    print(f"  - {url}")
+        if failed_urls:
+            print(f"\n{Fore.RED}Failed URLs:\n  - " + '\n  - '.join(failed_urls))
         
         return results
 
 
 def main():
     """Main function for command-line interface."""
+    parser = argparse.ArgumentParser(description="Download YouTube videos and playlists")
+    parser.add_argument('--refresh-metadata', action='store_true',
+                        help="Ignore playlist information cached by earlier runs")
+    parser.add_argument('--aria2c', action='store_true',
+                        help="Download through aria2c (must be installed) using several connections per file")
+    parser.add_argument('--batch-file', metavar='FILE',
+                        help="Download the URLs listed in FILE (one per line, '-' for stdin) "
+                             "without prompting")
+    args = parser.parse_args()
+    
+    metadata_cache = open_metadata_cache(refresh=args.refresh_metadata)
+    
     print(f"{Fore.CYAN}🎬 YouTube Downloader")
     print("=" * 50)
     
+    if args.batch_file:
+        return batch_main(args.batch_file, metadata_cache, use_aria2c=args.aria2c)
+    
     # Ask about subtitle preferences
     print(f"\n{Fore.YELLOW}Subtitle Options:")
     while True:
@@ -483,7 +761,9 @@ def main():
     
     downloader = YouTubeDownloader(
         download_subtitles=download_subtitles,
-        embed_subtitles=embed_subs
+        embed_subtitles=embed_subs,
+        metadata_cache=metadata_cache,
+        use_aria2c=args.aria2c
     )
     
     print(f"\n{Fore.GREEN}📝 Subtitle settings:")
@@ -511,7 +791,7 @@ def main():
                     continue
             
             # Basic URL validation
-            if 'youtube.com' in url or 'youtu.be' in url:
+            if _YT_HOST_RE.search(url):
                 urls.append(url)
                 print(f"{Fore.GREEN}✓ Added: {url}")
             else:
@@ -534,5 +814,31 @@ def main():
     print(f"{Fore.CYAN}Check the 'Downloads' folder for your videos.")
 
 
+def batch_main(batch_file: str, metadata_cache: Optional[MetadataCache] = None,
+               use_aria2c: bool = False):
+    """Download every URL in batch_file with the default settings, without prompting."""
+    text = sys.stdin.read() if batch_file == '-' else Path(batch_file).read_text(encoding='utf-8')
+    lines = [line.strip() for line in text.splitlines()]
+    lines = [line for line in lines if line and not line.startswith('#')]
+    
+    urls = []
+    for url in lines:
+        if _YT_HOST_RE.search(url):
+            urls.append(url)
+        else:
+            print(f"{Fore.RED}✗ Invalid YouTube URL: {url}")
+    
+    if not urls:
+        print(f"{Fore.RED}No valid URLs provided")
+        return
+    
+    downloader = YouTubeDownloader(metadata_cache=metadata_cache, use_aria2c=use_aria2c)
+    print(f"\n{Fore.CYAN}Starting downloads...")
+    downloader.download_multiple_urls(urls)
+    
+    print(f"\n{Fore.CYAN}Downloads completed!")
+    print(f"{Fore.CYAN}Check the 'Downloads' folder for your videos.")
+
+
 if __name__ == "__main__":
     main()